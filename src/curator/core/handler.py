@@ -2,7 +2,7 @@ import asyncio
 import functools
 import logging
 from datetime import datetime
-from typing import Any, Optional, cast
+from typing import Any, Optional
 
 import httpx
 from fastapi import WebSocketDisconnect
@@ -64,7 +64,7 @@ from curator.db.dal_uploads import (
 )
 from curator.db.dal_users import ensure_user
 from curator.db.engine import get_session
-from curator.db.models import Batch, Preset, UploadItem, UploadStatus
+from curator.db.models import Batch, Preset, UploadStatus
 from curator.handlers.interfaces import Handler as BaseHandler
 from curator.handlers.mapillary_handler import MapillaryHandler
 from curator.mediawiki.client import MediaWikiClient
@@ -285,7 +285,7 @@ class Handler:
                 userid=self.user["userid"],
                 username=self.username,
                 batchid=batchid,
-                payload=cast(list[UploadItem], items),
+                payload=items,
                 handler=handler_name,
                 encrypted_access_token=encrypted_access_token,
             )
@@ -9,12 +9,11 @@ from sqlalchemy import select as sa_select
 from sqlalchemy.orm import class_mapper, selectinload
 from sqlmodel import Session, col, func, select, update
 
-from curator.asyncapi import BatchUploadItem
+from curator.asyncapi import BatchUploadItem, UploadItem
 from curator.db.dal_batches import create_batch
 from curator.db.models import (
     Batch,
     StructuredError,
-    UploadItem,
     UploadRequest,
     UploadStatus,
     User,
@@ -178,21 +177,14 @@ def create_upload_requests_for_batch(
     userid: str,
     username: str,
     batchid: int,
-    payload: list[UploadItem],
+    payload: Sequence[UploadItem],
     handler: str,
     encrypted_access_token: str,
 ) -> list[UploadRequest]:
     reqs: list[UploadRequest] = []
     for item in payload:
-        labels_data = None
-        if item.labels:
-            model_dump = getattr(item.labels, "model_dump", None)
-            if callable(model_dump):
-                labels_data = model_dump(mode="json")
-            else:
-                labels_data = item.labels
-
-        copyright_override = bool(getattr(item, "copyright_override", False))
+        labels_data = item.labels.model_dump(mode="json") if item.labels else None
+        copyright_override = bool(item.copyright_override)
 
         req = UploadRequest(
             userid=userid,
@@ -189,15 +189,6 @@ class UploadRequest(SQLModel, table=True):
     batch: Optional[Batch] = Relationship(back_populates="uploads")
 
 
-class UploadItem(SQLModel):
-    id: str
-    input: str
-    title: str
-    wikitext: str
-    labels: Optional[Label] = None
-    copyright_override: bool = False
-
-
 class RetrySelectedUploadsRequest(SQLModel):
     upload_ids: list[int]
 
@@ -1,3 +1,4 @@
+import functools
 from datetime import datetime
 from typing import Annotated, Union
 
@@ -106,14 +107,25 @@ ServerMessage = Annotated[
     Field(discriminator="type"),
 ]
 
-_ClientMessageAdapter = TypeAdapter(ClientMessage)
 _ServerMessageAdapter = TypeAdapter(ServerMessage)
 
 
+@functools.lru_cache(maxsize=1)
+def get_client_message_adapter() -> TypeAdapter[ClientMessage]:
+    """Return the shared ClientMessage adapter, building its schema only once."""
+    return TypeAdapter(ClientMessage)
+
+
 class AsyncAPIWebSocket(WebSocket):
     async def receive_json(self, mode: str = "text") -> ClientMessage:
-        data = await super().receive_json(mode=mode)
-        return _ClientMessageAdapter.validate_python(data)
+        if mode not in {"text", "binary"}:
+            raise RuntimeError('The "mode" argument should be "text" or "binary".')
+        # Validate the raw frame in pydantic-core instead of json.loads + dict walk
+        if mode == "binary":
+            raw: str | bytes = await self.receive_bytes()
+        else:
+            raw = await self.receive_text()
+        return get_client_message_adapter().validate_json(raw)
 
     async def send_json(self, data: ServerMessage, mode: str = "text") -> None:
         await super().send_json(
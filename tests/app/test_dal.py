@@ -1,5 +1,6 @@
 """Tests for core data access layer functions."""
 
+from curator.asyncapi import UploadItem
 from curator.db.dal_batches import get_batch
 from curator.db.dal_uploads import (
     create_upload_requests_for_batch,
@@ -8,7 +9,7 @@ from curator.db.dal_uploads import (
     reset_failed_uploads_to_new_batch,
     retry_selected_uploads_to_new_batch,
 )
-from curator.db.models import UploadItem
+from curator.db.models import Batch
 
 
 def test_get_upload_request_by_id(mocker, mock_session):
@@ -119,11 +120,40 @@ def test_create_upload_requests_for_batch_persists_required_fields(mock_session)
     mock_session.flush.assert_called_once()
 
 
+def test_create_upload_requests_for_batch_maps_wire_payload(mock_session):
+    """Test that a validated wire payload maps onto upload request columns."""
+    item = UploadItem.model_validate(
+        {
+            "id": "img1",
+            "input": "seq1",
+            "title": "Test Image",
+            "wikitext": "Some wikitext",
+            "labels": {"language": "en", "value": "Label"},
+            "copyright_override": True,
+        }
+    )
+
+    reqs = create_upload_requests_for_batch(
+        session=mock_session,
+        userid="user123",
+        username="testuser",
+        batchid=1,
+        payload=[item],
+        handler="mapillary",
+        encrypted_access_token="encrypted_token",
+    )
+
+    assert reqs[0].key == "img1"
+    assert reqs[0].collection == "seq1"
+    assert reqs[0].filename == "Test Image"
+    assert reqs[0].labels == {"language": "en", "value": "Label"}
+    assert reqs[0].copyright_override is True
+
+
 def test_reset_failed_uploads_to_new_batch_copies_uploads(mocker, mock_session):
     """Test that reset_failed_uploads_to_new_batch creates copies, leaving originals unchanged"""
-    mock_batch = mocker.MagicMock()
-    mock_batch.id = 123
-    mock_batch.userid = "user1"
+    mock_batch = mocker.create_autospec(Batch, instance=True)
+    mock_batch.configure_mock(id=123, userid="user1")
     mock_session.get.return_value = mock_batch
 
     mock_failed_upload1 = mocker.MagicMock()
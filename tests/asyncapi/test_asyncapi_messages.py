@@ -1,35 +1,45 @@
 """Tests for AsyncAPI message serialization and validation."""
 
+from types import MappingProxyType
+from unittest.mock import AsyncMock
+
 import pytest
-from pydantic import TypeAdapter, ValidationError
+from pydantic import ValidationError
 
 from curator.asyncapi import (
     FetchBatches,
     FetchBatchUploads,
     FetchImages,
     SubscribeBatch,
-    Upload,
-    UploadData,
-    UploadItem,
 )
-from curator.protocol import ClientMessage
-
-adapter = TypeAdapter(ClientMessage)
-
+from curator.protocol import AsyncAPIWebSocket, get_client_message_adapter
 
-def test_fetch_images_payload():
-    """Test that FETCH_IMAGES message deserializes correctly."""
-    data = {"type": "FETCH_IMAGES", "data": "Q42", "handler": "mapillary"}
-    obj = adapter.validate_python(data)
-    assert isinstance(obj, FetchImages)
-    assert obj.type == "FETCH_IMAGES"
-    assert obj.data == "Q42"
-    assert obj.handler.value == "mapillary"
+adapter = get_client_message_adapter()
 
+_UPLOAD_PAYLOAD = MappingProxyType(
+    {
+        "type": "UPLOAD",
+        "data": MappingProxyType(
+            {
+                "items": (
+                    MappingProxyType(
+                        {
+                            "id": "1",
+                            "input": "test.jpg",
+                            "title": "Test Image",
+                            "wikitext": "Some wikitext",
+                            "copyright_override": True,
+                        }
+                    ),
+                ),
+                "handler": "mapillary",
+            }
+        ),
+    }
+)
 
-def test_upload_payload():
-    """Test that UPLOAD message deserializes correctly with nested data."""
-    data = {
+_UPLOAD_EXPECTED = MappingProxyType(
+    {
         "type": "UPLOAD",
         "data": {
             "items": [
@@ -44,22 +54,28 @@ def test_upload_payload():
             "handler": "mapillary",
         },
     }
-    obj = adapter.validate_python(data)
-    assert isinstance(obj, Upload)
-    assert obj.type == "UPLOAD"
-    assert isinstance(obj.data, UploadData)
-    assert len(obj.data.items) == 1
-    assert isinstance(obj.data.items[0], UploadItem)
-    assert obj.data.items[0].id == "1"
-    assert obj.data.items[0].copyright_override is True
-    assert obj.data.handler == "mapillary"
+)
+
+
+def test_fetch_images_payload():
+    """Test that FETCH_IMAGES message deserializes correctly."""
+    data = {"type": "FETCH_IMAGES", "data": "Q42", "handler": "mapillary"}
+    obj = FetchImages.model_validate(data)
+    assert obj.type == "FETCH_IMAGES"
+    assert obj.data == "Q42"
+    assert obj.handler.value == "mapillary"
+
+
+def test_upload_payload():
+    """Test that UPLOAD message deserializes correctly with nested data."""
+    obj = adapter.validate_python(_UPLOAD_PAYLOAD)
+    assert obj.model_dump(mode="python", exclude_none=True) == _UPLOAD_EXPECTED
 
 
 def test_subscribe_batch_payload():
     """Test that SUBSCRIBE_BATCH message deserializes correctly."""
     data = {"type": "SUBSCRIBE_BATCH", "data": 123}
-    obj = adapter.validate_python(data)
-    assert isinstance(obj, SubscribeBatch)
+    obj = SubscribeBatch.model_validate(data)
     assert obj.type == "SUBSCRIBE_BATCH"
     assert obj.data == 123
 
@@ -70,8 +86,7 @@ def test_fetch_batches_payload():
         "type": "FETCH_BATCHES",
         "data": {"page": 1, "limit": 10, "userid": "user123"},
     }
-    obj = adapter.validate_python(data)
-    assert isinstance(obj, FetchBatches)
+    obj = FetchBatches.model_validate(data)
     assert obj.type == "FETCH_BATCHES"
     assert obj.data.page == 1
     assert obj.data.limit == 10
@@ -81,24 +96,45 @@ def test_fetch_batches_payload():
 def test_fetch_batch_uploads_payload():
     """Test that FETCH_BATCH_UPLOADS message deserializes correctly."""
     data = {"type": "FETCH_BATCH_UPLOADS", "data": 456}
-    obj = adapter.validate_python(data)
-    assert isinstance(obj, FetchBatchUploads)
+    obj = FetchBatchUploads.model_validate(data)
     assert obj.type == "FETCH_BATCH_UPLOADS"
     assert obj.data == 456
 
 
 def test_invalid_payload_type():
     """Test that invalid message type raises ValidationError."""
-    data = {"type": "INVALID_TYPE", "data": {}}
-    with pytest.raises(ValidationError):  # Pydantic raises ValidationError
-        adapter.validate_python(data)
+    with pytest.raises(ValidationError):  # Rejected at the discriminator tag
+        adapter.validate_json(b'{"type":"INVALID_TYPE","data":{}}')
 
 
 def test_fetch_batches_default_values():
     """Test that FETCH_BATCHES uses default values for optional fields."""
     data = {"type": "FETCH_BATCHES", "data": {}}
-    obj = adapter.validate_python(data)
-    assert isinstance(obj, FetchBatches)
+    obj = FetchBatches.model_validate(data)
     assert obj.data.page == 1
     assert obj.data.limit == 100
     assert obj.data.userid is None
+
+
+def test_client_message_adapter_is_cached():
+    """Test that the ClientMessage adapter is built once and reused."""
+    assert get_client_message_adapter() is adapter
+
+
+def test_validate_json_matches_validate_python():
+    """Test that parsing raw JSON frames yields the same message as parsed dicts."""
+    raw = b'{"type":"FETCH_BATCHES","data":{"page":2,"limit":5}}'
+    assert adapter.validate_json(raw) == adapter.validate_python(
+        {"type": "FETCH_BATCHES", "data": {"page": 2, "limit": 5}}
+    )
+
+
+@pytest.mark.asyncio
+async def test_receive_json_rejects_unknown_mode():
+    """Test that an unknown mode raises like Starlette's receive_json does."""
+    receive = AsyncMock()
+    ws = AsyncAPIWebSocket({"type": "websocket"}, receive, AsyncMock())
+
+    with pytest.raises(RuntimeError, match='"text" or "binary"'):
+        await ws.receive_json(mode="bytes")
+    receive.assert_not_called()
@@ -1,13 +1,10 @@
 """Tests for label serialization in AsyncAPI models."""
 
-from typing import cast
 from unittest.mock import patch
 
-from curator.asyncapi import Label
-from curator.asyncapi import UploadItem as AsyncUploadItem
+from curator.asyncapi import Label, UploadItem
 from curator.db.dal_uploads import create_upload_requests_for_batch
-from curator.db.models import UploadItem as ModelUploadItem
-from curator.db.models import UploadRequest
+from curator.db.models import Batch, UploadRequest
 
 
 def test_create_upload_request_label_serialization(mocker, mock_session):
@@ -16,15 +13,15 @@ def test_create_upload_request_label_serialization(mocker, mock_session):
         patch("curator.db.dal_users.ensure_user"),
         patch("curator.db.dal_batches.create_batch") as mock_create_batch,
     ):
-        mock_batch = mocker.MagicMock()
-        mock_batch.id = 123
+        mock_batch = mocker.create_autospec(Batch, instance=True)
+        mock_batch.configure_mock(id=123)
         mock_create_batch.return_value = mock_batch
 
         # Create a Label object (Pydantic model)
         label = Label(language="en", value="Photo from Mapillary")
 
         # Create an UploadItem with the Label object
-        item = AsyncUploadItem(
+        item = UploadItem(
             id="img1",
             input="test_collection",
             title="Test Title",
@@ -32,13 +29,13 @@ def test_create_upload_request_label_serialization(mocker, mock_session):
             labels=label,
         )
 
-        # Call the function, casting to match the expected type in the app
+        # Call the function
         reqs = create_upload_requests_for_batch(
             session=mock_session,
             userid="user123",
             username="testuser",
             batchid=123,
-            payload=cast(list[ModelUploadItem], [item]),
+            payload=[item],
             handler="mapillary",
             encrypted_access_token="encrypted_token",
         )
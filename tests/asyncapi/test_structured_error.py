@@ -1,6 +1,8 @@
 """Tests for structured error handling in AsyncAPI."""
 
-from unittest.mock import Mock, patch
+from unittest.mock import patch
+
+import pytest
 
 from curator.asyncapi import (
     DuplicateError,
@@ -12,6 +14,20 @@ from curator.db.dal_uploads import update_upload_status
 from curator.db.models import UploadRequest
 
 
+@pytest.fixture(scope="module")
+def patched_update():
+    """Patch dal_uploads.update once for the module."""
+    with patch("curator.db.dal_uploads.update") as mock_update:
+        yield mock_update
+
+
+@pytest.fixture
+def mock_update(patched_update):
+    """Module-wide update mock with call history cleared for each test"""
+    patched_update.reset_mock()
+    return patched_update
+
+
 def test_upload_request_model_validation():
     """Test that UploadRequest model accepts structured error data."""
     error_data = DuplicateError(
@@ -82,20 +98,14 @@ def test_upload_request_model_validation_title_blacklisted_error():
     assert req.error.message == "Title contains blacklisted pattern"
 
 
-@patch("curator.db.dal_uploads.update")
 def test_update_upload_status_with_error(mock_update, mock_session):
     """Test update_upload_status calls session.exec with correct update statement."""
     error_model = GenericError(message="Something went wrong")
 
-    # Setup the mock update chain
     # update(UploadRequest) -> .where(...) -> .values(...)
-    mock_update_stmt = Mock()
-    mock_where_clause = Mock()
-    mock_values_clause = Mock()
-
-    mock_update.return_value = mock_update_stmt
-    mock_update_stmt.where.return_value = mock_where_clause
-    mock_where_clause.values.return_value = mock_values_clause
+    mock_update_stmt = mock_update.return_value
+    mock_where_clause = mock_update_stmt.where.return_value
+    mock_values_clause = mock_where_clause.values.return_value
 
     upload_id = 123
 
@@ -124,7 +134,6 @@ def test_update_upload_status_with_error(mock_update, mock_session):
     mock_session.flush.assert_called_once()
 
 
-@patch("curator.db.dal_uploads.update")
 def test_update_upload_status_with_duplicate_error(mock_update, mock_session):
     """Test update_upload_status with DuplicateError."""
     error_model = DuplicateError(
@@ -132,14 +141,9 @@ def test_update_upload_status_with_duplicate_error(mock_update, mock_session):
         links=[ErrorLink(title="Existing File", url="http://example.com")],
     )
 
-    # Setup the mock update chain
-    mock_update_stmt = Mock()
-    mock_where_clause = Mock()
-    mock_values_clause = Mock()
-
-    mock_update.return_value = mock_update_stmt
-    mock_update_stmt.where.return_value = mock_where_clause
-    mock_where_clause.values.return_value = mock_values_clause
+    mock_update_stmt = mock_update.return_value
+    mock_where_clause = mock_update_stmt.where.return_value
+    mock_values_clause = mock_where_clause.values.return_value
 
     upload_id = 456
 
@@ -168,19 +172,13 @@ def test_update_upload_status_with_duplicate_error(mock_update, mock_session):
     mock_session.flush.assert_called_once()
 
 
-@patch("curator.db.dal_uploads.update")
 def test_update_upload_status_with_title_blacklisted_error(mock_update, mock_session):
     """Test update_upload_status with TitleBlacklistedError."""
     error_model = TitleBlacklistedError(message="Title contains blacklisted pattern")
 
-    # Setup the mock update chain
-    mock_update_stmt = Mock()
-    mock_where_clause = Mock()
-    mock_values_clause = Mock()
-
-    mock_update.return_value = mock_update_stmt
-    mock_update_stmt.where.return_value = mock_where_clause
-    mock_where_clause.values.return_value = mock_values_clause
+    mock_update_stmt = mock_update.return_value
+    mock_where_clause = mock_update_stmt.where.return_value
+    mock_values_clause = mock_where_clause.values.return_value
 
     upload_id = 789
 
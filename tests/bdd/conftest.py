@@ -1,25 +1,26 @@
-"""Global fixtures and helpers for BDD tests."""
+"""Global fixtures and helpers for BDD tests.
+
+Shared fixtures from fixtures.py are already provided by tests/conftest.py.
+"""
 
 import inspect
-import sys
-from pathlib import Path
+from unittest.mock import MagicMock
 
 import pytest
+from fastapi.testclient import TestClient
+from starlette.middleware import Middleware
 
-# Add tests directory to path if not already there
-tests_dir = str(Path(__file__).parent.parent)
-if tests_dir not in sys.path:
-    sys.path.insert(0, tests_dir)
-
-# Import all shared fixtures from fixtures.py
-from fixtures import *  # noqa: E402, F403, F406
+from curator.admin import check_admin
+from curator.core.auth import check_login
+from curator.core.handler import Handler
+from curator.main import app
 
 # Import step definitions so pytest-bdd can discover them
 # Import the module to trigger decorator registration
-from . import conftest_steps  # noqa: E402, F406
+from . import conftest_steps
 
 # Import database fixtures
-from .conftest_db import *  # noqa: E402, F403, F406
+from .conftest_db import *  # noqa: F403
 
 # Copy the step definition fixtures to this module so pytest-bdd can find them
 for name, obj in inspect.getmembers(conftest_steps):
@@ -27,14 +28,50 @@ for name, obj in inspect.getmembers(conftest_steps):
         globals()[name] = obj
 
 
-@pytest.fixture
-def client(engine, mocker):
-    """Test client fixture for BDD tests"""
-    from fastapi.testclient import TestClient
+@pytest.fixture(autouse=True)
+def _clear_seeded_auth():
+    """Start every scenario logged out, before any given step runs"""
+    conftest_steps.SeedSessionMiddleware.session = None
+    conftest_steps.auth_overrides.clear()
 
-    from curator.main import app
 
-    app.dependency_overrides = {}
+@pytest.fixture(scope="package")
+def _session_client(engine):
+    """One TestClient (and app lifespan) shared by the whole BDD package"""
+    # Innermost, so it runs after starsessions has loaded scope["session"]
+    seed = Middleware(conftest_steps.SeedSessionMiddleware)
+    app.user_middleware.append(seed)
+    app.middleware_stack = None
+    app.dependency_overrides.clear()
+    app.dependency_overrides.update(
+        {
+            check_login: conftest_steps.override_check_login,
+            check_admin: conftest_steps.override_check_admin,
+        }
+    )
     with TestClient(app) as c:
         yield c
-    app.dependency_overrides = {}
+    app.dependency_overrides.clear()
+    app.user_middleware.remove(seed)
+    app.middleware_stack = None
+
+
+@pytest.fixture
+def client(_session_client):
+    """Test client fixture for BDD tests"""
+    _session_client.cookies.clear()
+    return _session_client
+
+
+@pytest.fixture
+def testuser_handler(mock_sender):
+    """One Handler for testuser (12345) shared by every step of a scenario"""
+    return Handler(
+        {
+            "username": "testuser",
+            "userid": "12345",
+            "access_token": conftest_steps._FAKE_TOKEN,
+        },
+        mock_sender,
+        MagicMock(),
+    )
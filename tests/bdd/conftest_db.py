@@ -2,33 +2,144 @@
 Database fixtures for BDD tests.
 """
 
+from datetime import datetime, timezone
+from unittest.mock import patch
+
 import pytest
+from sqlalchemy import event
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.pool import StaticPool
 from sqlmodel import Session, SQLModel, create_engine
 
+from curator.db.models import Batch, User
+
+
+def _disable_pysqlite_transactions(dbapi_connection, connection_record):
+    # pysqlite emits its own BEGIN lazily, which breaks SAVEPOINT handling
+    dbapi_connection.isolation_level = None
+
+
+def _set_test_pragmas(dbapi_connection, connection_record):
+    # Durability is irrelevant for a throwaway database; keep a journal so
+    # SAVEPOINT rollback still works
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=MEMORY")
+    cursor.execute("PRAGMA synchronous=OFF")
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    cursor.execute("PRAGMA foreign_keys=OFF")
+    cursor.close()
+
+
+def _emit_begin(conn):
+    conn.exec_driver_sql("BEGIN")
+
+
+def utcnow() -> datetime:
+    """Naive UTC now; Core inserts bypass the models' default_factory timestamps"""
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+def seed_user(session: Session, userid: str = "12345") -> None:
+    """INSERT OR IGNORE the test user; unlike merge() this skips the SELECT"""
+    now = utcnow()
+    session.exec(
+        sqlite_insert(User)
+        .values(userid=userid, username="testuser", created_at=now, updated_at=now)
+        .on_conflict_do_nothing()
+    )
+
+
+def seed_batch(
+    session: Session,
+    batch_id: int,
+    userid: str = "12345",
+    edit_group_id: str = "testbatch12345",
+) -> None:
+    """Upsert a batch by id, re-owning an existing one as merge() would"""
+    seed_batches(
+        session, [{"id": batch_id, "userid": userid, "edit_group_id": edit_group_id}]
+    )
+
+
+def seed_batches(session: Session, rows: list[dict]) -> None:
+    """Upsert batches by id in one executemany; rows carry id, userid, edit_group_id"""
+    now = utcnow()
+    stmt = sqlite_insert(Batch)
+    session.exec(
+        stmt.on_conflict_do_update(
+            index_elements=["id"],
+            set_={
+                "userid": stmt.excluded.userid,
+                "edit_group_id": stmt.excluded.edit_group_id,
+            },
+        ),
+        params=[{**row, "created_at": now, "updated_at": now} for row in rows],
+    )
 
-@pytest.fixture(name="engine", scope="session")
-def engine_fixture(session_mocker):
+
+@pytest.fixture(name="engine", scope="package")
+def engine_fixture():
     """
     Use strictly in-memory SQLite with StaticPool to ensure all connections
     share the same state without creating any files on disk.
+
+    Yields a single long-lived Connection inside an outer transaction. It is
+    patched in as the application engine, so every Session(engine) joins that
+    transaction and per-test isolation is a SAVEPOINT rollback in clean_db.
+
+    Package-scoped, so the engine patch is undone once the BDD package finishes
+    and never leaks into non-BDD tests. Each pytest-xdist worker is a separate
+    process, so ``:memory:`` already gives every worker its own database.
     """
     engine = create_engine(
         "sqlite:///:memory:",
         connect_args={"check_same_thread": False},
         poolclass=StaticPool,
     )
+    event.listen(engine, "connect", _disable_pysqlite_transactions)
+    event.listen(engine, "connect", _set_test_pragmas)
+    event.listen(engine, "begin", _emit_begin)
     SQLModel.metadata.create_all(engine)
 
+    connection = engine.connect()
+    transaction = connection.begin()
+
     # Patch the global engine in the db module
-    session_mocker.patch("curator.db.engine.engine", engine)
+    with patch("curator.db.engine.engine", connection):
+        yield connection
 
-    yield engine
+    try:
+        transaction.rollback()
+        connection.close()
+    finally:
+        engine.dispose()
 
 
 @pytest.fixture(autouse=True)
 def clean_db(engine):
-    with Session(engine) as session:
-        for table in reversed(SQLModel.metadata.sorted_tables):
-            session.exec(table.delete())
-        session.commit()
+    savepoint = engine.begin_nested()
+    yield
+    savepoint.rollback()
+
+
+@pytest.fixture
+def db_session(engine):
+    """Session shared by the steps of one scenario
+
+    Steps flush rather than commit: the session is bound to the test connection,
+    so a flush already makes rows visible to the app, and clean_db's SAVEPOINT
+    rollback discards them afterwards. The identity map is not refreshed after
+    the app writes, so a step should not load an entity that a later step
+    re-reads; select columns or counts instead.
+    """
+    with Session(engine) as s:
+        yield s
+
+
+@pytest.fixture
+def default_batch(db_session) -> int:
+    """Seed the default user and batch 1 once per scenario and return the batch id"""
+    seed_user(db_session)
+    seed_batch(db_session, 1)
+    db_session.flush()
+    return 1
@@ -2,40 +2,140 @@
 BDD step definitions for feature tests.
 """
 
-from unittest.mock import MagicMock, PropertyMock
+import functools
 
-from fastapi import HTTPException
+from fastapi import HTTPException, Request
 from mwoauth import AccessToken
 from pytest_bdd import given, parsers
-from sqlmodel import Session, col, select
+from sqlalchemy import String, case, cast, func, insert, literal, update
+from sqlmodel import col, select
+from starlette.requests import HTTPConnection
 
 from curator.admin import check_admin
 from curator.core.auth import check_login
-from curator.core.handler import Handler
 from curator.db.models import Batch, UploadRequest, User
 
+from .conftest_db import seed_batch, seed_batches, seed_user, utcnow
+
+
+class SeedSessionMiddleware:
+    """Innermost ASGI middleware that replaces scope["session"] with the seeded dict
+
+    A plain class attribute rather than a ContextVar: the session TestClient runs
+    the app on its portal thread, whose context predates the given steps.
+    """
+
+    session: dict | None = None
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        session = SeedSessionMiddleware.session
+        if session is not None and scope["type"] in ("http", "websocket"):
+            scope["session"] = session
+        await self.app(scope, receive, send)
+
+
+# What the session-wide check_login/check_admin overrides answer with; keys are
+# "user" and "check_admin". Empty means fall through to the real dependency.
+auth_overrides: dict = {}
+
+
+async def override_check_login(request: HTTPConnection):
+    user = auth_overrides.get("user")
+    if user is None:
+        return await check_login(request)
+    return user
+
+
+def override_check_admin(request: Request):
+    admin_check = auth_overrides.get("check_admin")
+    if admin_check is None:
+        return check_admin(request)
+    return admin_check()
+
 
 def _setup_session(
-    app,
-    mocker,
     u: dict,
-    extra_overrides: dict | None = None,
+    admin_check=None,
     session_dict: dict | None = None,
 ) -> dict:
-    """Configure FastAPI dependency overrides and session mock for a test user."""
-    app.dependency_overrides[check_login] = lambda: u
-    if extra_overrides:
-        app.dependency_overrides.update(extra_overrides)
-    mocker.patch(
-        "starlette.requests.Request.session",
-        new_callable=PropertyMock,
-        return_value=session_dict or {"user": u},
-    )
+    """Point the auth overrides and the seeded session at a test user."""
+    auth_overrides["user"] = u
+    if admin_check is not None:
+        auth_overrides["check_admin"] = admin_check
+    SeedSessionMiddleware.session = session_dict or {"user": u}
     return u
 
 
-def run_sync(coro, loop):
-    return loop.run_until_complete(coro)
+def async_to_sync(fn):
+    """Run an async step on the session event loop; pytest-bdd only calls sync steps.
+
+    The wrapped step must request the ``event_loop`` fixture.
+    """
+
+    @functools.wraps(fn)
+    def wrapper(*args, **kwargs):
+        return kwargs["event_loop"].run_until_complete(fn(*args, **kwargs))
+
+    return wrapper
+
+
+# AccessToken is an immutable tuple, so one instance serves every test user
+_FAKE_TOKEN = AccessToken("v", "s")
+
+# Columns every seeded upload request shares
+_UPLOAD_DEFAULTS = {
+    "userid": "12345",
+    "handler": "mapillary",
+    "wikitext": "W",
+    "access_token": "E",
+    "copyright_override": False,
+}
+
+
+def _upload_row(batchid: int, status: str, key: str, **overrides) -> dict:
+    """Column values for a Core insert into upload_requests."""
+    now = utcnow()
+    return {
+        **_UPLOAD_DEFAULTS,
+        "batchid": batchid,
+        "status": status,
+        "key": key,
+        "filename": f"{key}.jpg",
+        "created_at": now,
+        "updated_at": now,
+        **overrides,
+    }
+
+
+def _batch_rows(count: int) -> list[dict]:
+    """Column values for a Core insert of count batches owned by the test user."""
+    now = utcnow()
+    return [
+        {
+            "userid": "12345",
+            "edit_group_id": f"batch{i:06d}",
+            "created_at": now,
+            "updated_at": now,
+        }
+        for i in range(count)
+    ]
+
+
+def add_upload(session, batchid: int, status: str, key: str, **overrides) -> None:
+    """Insert one upload request row; the shared body of the upload given steps."""
+    session.exec(
+        insert(UploadRequest).values(**_upload_row(batchid, status, key, **overrides))
+    )
+
+
+def count_uploads(session, *criteria) -> int:
+    """SELECT count(*) of upload requests matching criteria, without loading rows."""
+    return session.exec(
+        select(func.count()).select_from(UploadRequest).where(*criteria)
+    ).one()
 
 
 @given(
@@ -48,32 +148,28 @@ def run_sync(coro, loop):
     ),
     target_fixture="active_user",
 )
-def step_given_user(userid, mocker, username="testuser"):
-    from curator.main import app
-
+def step_given_user(userid, username="testuser"):
     u = {
         "username": username,
         "userid": userid,
         "sub": userid,
-        "access_token": AccessToken("v", "s"),
+        "access_token": _FAKE_TOKEN,
     }
-    return _setup_session(app, mocker, u)
+    return _setup_session(u)
 
 
 @given(
     parsers.re(r'I am logged in as admin "(?P<username>[^"]+)"'),
     target_fixture="active_user",
 )
-def step_given_admin(username, mocker):
-    from curator.main import app
-
+def step_given_admin(username):
     u = {
         "username": "DaxServer",
         "userid": "admin123",
         "sub": "admin123",
-        "access_token": AccessToken("v", "s"),
+        "access_token": _FAKE_TOKEN,
     }
-    return _setup_session(app, mocker, u, extra_overrides={check_admin: lambda: None})
+    return _setup_session(u, admin_check=lambda: None)
 
 
 @given(
@@ -84,14 +180,12 @@ def step_given_admin(username, mocker):
     parsers.re(r'I have an active session for "(?P<username>[^"]+)"'),
     target_fixture="active_user",
 )
-def step_given_std_user(username, mocker, session_context):
-    from curator.main import app
-
+def step_given_std_user(username, session_context):
     u = {
         "username": username,
         "userid": "u1",
         "sub": "u1",
-        "access_token": AccessToken("v", "s"),
+        "access_token": _FAKE_TOKEN,
     }
 
     def _f():
@@ -99,45 +193,30 @@ def step_given_std_user(username, mocker, session_context):
 
     session_dict = {"user": u}
     session_context["dict"] = session_dict
-    return _setup_session(
-        app, mocker, u, extra_overrides={check_admin: _f}, session_dict=session_dict
-    )
+    return _setup_session(u, admin_check=_f, session_dict=session_dict)
 
 
 @given(parsers.parse('a batch exists with id {batch_id:d} for user "{userid}"'))
-def step_given_batch(engine, batch_id, userid):
-    with Session(engine) as s:
-        s.merge(User(userid=userid, username="testuser"))
-        s.add(Batch(id=batch_id, userid=userid, edit_group_id="testbatch12345"))
-        s.commit()
+def step_given_batch(db_session, batch_id, userid):
+    seed_user(db_session, userid)
+    db_session.add(Batch(id=batch_id, userid=userid, edit_group_id="testbatch12345"))
+    db_session.flush()
 
 
 @given(parsers.parse('an upload request exists with status "{status}" and key "{key}"'))
-def step_given_upload_req(engine, status, key):
-    with Session(engine) as s:
-        s.merge(User(userid="12345", username="testuser"))
-
-        # Use existing batch or create one
-        b = s.get(Batch, 1)  # Try to get batch with id=1
-        if not b:
-            # Create a batch for the upload request
-            b = Batch(id=1, userid="12345", edit_group_id="testbatch12345")
-            s.add(b)
-            s.commit()
-
-        s.add(
-            UploadRequest(
-                batchid=b.id,
-                userid="12345",
-                status=status,
-                key=key,
-                handler="mapillary",
-                filename=f"{key}.jpg",
-                wikitext="W",
-                access_token="E",
-            )
-        )
-        s.commit()
+def step_given_upload_req(db_session, status, key):
+    seed_user(db_session)
+
+    # Use existing batch or create one
+    b = db_session.get(Batch, 1)  # Try to get batch with id=1
+    if not b:
+        # Create a batch for the upload request
+        b = Batch(id=1, userid="12345", edit_group_id="testbatch12345")
+        db_session.add(b)
+        db_session.flush()
+
+    add_upload(db_session, b.id, status, key)
+    db_session.flush()
 
 
 @given(
@@ -145,170 +224,104 @@ def step_given_upload_req(engine, status, key):
         'an upload request exists with status "{status}" and key "{key}" in batch 1'
     )
 )
-def step_given_upload_req_batch1(engine, status, key):
-    with Session(engine) as s:
-        s.merge(User(userid="12345", username="testuser"))
-        s.merge(Batch(id=1, userid="12345", edit_group_id="testbatch12345"))
-        s.commit()
-
-        s.add(
-            UploadRequest(
-                batchid=1,
-                userid="12345",
-                status=status,
-                key=key,
-                handler="mapillary",
-                filename=f"{key}.jpg",
-                wikitext="W",
-                access_token="E",
-            )
-        )
-        s.commit()
-
-
 @given(parsers.parse('an upload request exists with status "{status}" in batch 1'))
-def step_given_upload_in_batch1(engine, status):
-    """Create an upload request with given status in batch 1"""
-    with Session(engine) as s:
-        s.merge(User(userid="12345", username="testuser"))
-        s.merge(Batch(id=1, userid="12345", edit_group_id="testbatch12345"))
-        s.commit()
-
-        s.add(
-            UploadRequest(
-                batchid=1,
-                userid="12345",
-                status=status,
-                key="upload",
-                handler="mapillary",
-                filename="upload.jpg",
-                wikitext="W",
-                access_token="E",
-            )
-        )
-        s.commit()
+def step_given_upload_req_batch1(db_session, default_batch, status, key="upload"):
+    """Create an upload request with given status (and optional key) in batch 1"""
+    add_upload(db_session, default_batch, status, key)
+    db_session.flush()
 
 
 @given(
     parsers.parse('{count:d} upload requests exist with status "{status}" in batch 1')
 )
-def step_given_multiple_uploads_batch1(engine, count, status):
+def step_given_multiple_uploads_batch1(db_session, default_batch, count, status):
     """Create multiple upload requests with given status in batch 1"""
-    with Session(engine) as s:
-        s.merge(User(userid="12345", username="testuser"))
-        s.merge(Batch(id=1, userid="12345", edit_group_id="testbatch12345"))
-        s.commit()
-
-        for i in range(count):
-            s.add(
-                UploadRequest(
-                    batchid=1,
-                    userid="12345",
-                    status=status,
-                    key=f"img{i}",
-                    handler="mapillary",
-                    filename=f"img{i}.jpg",
-                    wikitext="W",
-                    access_token="E",
-                )
-            )
-        s.commit()
+    db_session.exec(
+        insert(UploadRequest),
+        params=[_upload_row(default_batch, status, f"img{i}") for i in range(count)],
+    )
+    db_session.flush()
 
 
 @given(parsers.parse("{count:d} batches exist in the database for my user"))
-@given(parsers.parse("there are {count:d} batches in the system"))
-def step_given_batches(engine, count):
-    with Session(engine) as s:
-        s.merge(User(userid="12345", username="testuser"))
-        for i in range(count):
-            s.add(Batch(userid="12345", edit_group_id=f"batch{i:06d}"))
-        s.commit()
+def step_given_batches(db_session, count):
+    seed_user(db_session)
+    db_session.exec(insert(Batch), params=_batch_rows(count))
+    db_session.flush()
 
 
 @given(parsers.parse("there are {count:d} users in the system"))
-def step_given_users(engine, count):
-    with Session(engine) as s:
-        for i in range(count):
-            s.add(User(userid=f"u{i}", username=f"user{i}"))
-        s.commit()
+def step_given_users(db_session, count):
+    now = utcnow()
+    db_session.exec(
+        insert(User),
+        params=[
+            {
+                "userid": f"u{i}",
+                "username": f"user{i}",
+                "created_at": now,
+                "updated_at": now,
+            }
+            for i in range(count)
+        ],
+    )
+    db_session.flush()
 
 
 @given(parsers.parse("{count:d} upload requests exist in batch {batch_id:d}"))
-def step_given_uploads_in_batch(engine, count, batch_id):
+def step_given_uploads_in_batch(db_session, count, batch_id):
     """Create multiple upload requests in a specific batch"""
-    with Session(engine) as s:
-        s.merge(User(userid="12345", username="testuser"))
-        s.merge(Batch(id=batch_id, userid="12345", edit_group_id="testbatch12345"))
-        s.commit()
-
-        for i in range(count):
-            s.add(
-                UploadRequest(
-                    batchid=batch_id,
-                    userid="12345",
-                    status="queued",
-                    key=f"img{i}",
-                    handler="mapillary",
-                    filename=f"img{i}.jpg",
-                    wikitext="W",
-                    access_token="E",
-                )
-            )
-        s.commit()
+    seed_user(db_session)
+    seed_batch(db_session, batch_id)
+    db_session.flush()
+
+    db_session.exec(
+        insert(UploadRequest),
+        params=[_upload_row(batch_id, "queued", f"img{i}") for i in range(count)],
+    )
+    db_session.flush()
 
 
 @given(parsers.parse('1 upload is "{status1}", 1 is "{status2}", and 1 is "{status3}"'))
-def step_given_mixed_status_uploads(engine, status1, status2, status3):
+def step_given_mixed_status_uploads(db_session, status1, status2, status3):
     """Set uploads to different statuses"""
-    with Session(engine) as s:
-        uploads = s.exec(
-            select(UploadRequest)
-            .where(UploadRequest.batchid == 1)
-            .order_by(col(UploadRequest.id))
-        ).all()
-        if len(uploads) >= 3:
-            uploads[0].status = status1
-            uploads[1].status = status2
-            uploads[2].status = status3
-            s.commit()
+    ids = db_session.exec(
+        select(col(UploadRequest.id))
+        .where(UploadRequest.batchid == 1)
+        .order_by(col(UploadRequest.id))
+        .limit(3)
+    ).all()
+    if len(ids) == 3:
+        statuses = dict(zip(ids, (status1, status2, status3)))
+        db_session.exec(
+            update(UploadRequest)
+            .where(col(UploadRequest.id).in_(ids))
+            .values(status=case(statuses, value=col(UploadRequest.id)))
+            .execution_options(synchronize_session=False)
+        )
+        db_session.flush()
 
 
 @given(parsers.parse("there are {count:d} upload requests in the system"))
-def step_given_upload_requests_count(engine, count):
-    with Session(engine) as s:
-        s.merge(User(userid="12345", username="testuser"))
-        for i in range(count):
-            b = Batch(userid="12345", edit_group_id=f"batch{i:06d}")
-            s.add(b)
-            s.commit()
-            s.refresh(b)
-            s.add(
-                UploadRequest(
-                    batchid=b.id,
-                    userid="12345",
-                    status="queued",
-                    key=f"img{i}",
-                    handler="mapillary",
-                    filename=f"img{i}.jpg",
-                    wikitext="W",
-                    access_token="E",
-                )
-            )
-        s.commit()
+def step_given_upload_requests_count(db_session, count):
+    seed_user(db_session)
+    batch_ids = db_session.exec(
+        insert(Batch).returning(col(Batch.id), sort_by_parameter_order=True),
+        params=_batch_rows(count),
+    ).scalars()
+    db_session.exec(
+        insert(UploadRequest),
+        params=[
+            _upload_row(bid, "queued", f"img{i}") for i, bid in enumerate(batch_ids)
+        ],
+    )
+    db_session.flush()
 
 
 @given("I am subscribed to batch 1")
-def step_given_subscribed(mock_sender, event_loop):
-    h = Handler(
-        {
-            "username": "testuser",
-            "userid": "12345",
-            "access_token": AccessToken("v", "v"),
-        },
-        mock_sender,
-        MagicMock(),
-    )
-    run_sync(h.subscribe_batch(1), event_loop)
+@async_to_sync
+async def step_given_subscribed(testuser_handler, event_loop):
+    await testuser_handler.subscribe_batch(1)
 
 
 @given(
@@ -316,92 +329,63 @@ def step_given_subscribed(mock_sender, event_loop):
         "2 upload requests exist for batch {batch_id:d} with various statuses"
     )
 )
-def step_given_batch_uploads(engine, batch_id):
+def step_given_batch_uploads(db_session, batch_id):
     """Create 2 upload requests with different statuses (completed and failed) in batch"""
-    with Session(engine) as s:
-        s.merge(User(userid="12345", username="testuser"))
-        s.merge(Batch(id=batch_id, userid="12345", edit_group_id="testbatch12345"))
-        s.commit()
-        b = s.exec(select(Batch).where(Batch.id == batch_id)).first()
-        assert b is not None
-        s.add(
-            UploadRequest(
-                batchid=b.id,
-                userid="12345",
-                status="completed",
-                key="img1",
-                handler="mapillary",
-                filename="img1.jpg",
-                wikitext="W",
-                access_token="E",
-            )
-        )
-        s.add(
-            UploadRequest(
-                batchid=b.id,
-                userid="12345",
-                status="failed",
-                key="img2",
-                handler="mapillary",
-                filename="img2.jpg",
-                wikitext="W",
-                access_token="E",
-            )
-        )
-        s.commit()
+    seed_user(db_session)
+    seed_batch(db_session, batch_id)
+    db_session.exec(
+        insert(UploadRequest),
+        params=[
+            _upload_row(batch_id, "completed", "img1"),
+            _upload_row(batch_id, "failed", "img2"),
+        ],
+    )
+    db_session.flush()
 
 
 @given(
     parsers.parse("the upload requests have Celery task IDs stored"),
     target_fixture="task_ids",
 )
-def step_given_task_ids(engine):
+def step_given_task_ids(db_session):
     """Set task IDs for existing queued uploads"""
-    with Session(engine) as s:
-        uploads = s.exec(
-            select(UploadRequest).where(UploadRequest.status == "queued")
-        ).all()
-        task_ids = {}
-        for i, upload in enumerate(uploads):
-            task_id = f"celery-task-{upload.id}"
-            upload.celery_task_id = task_id
-            task_ids[upload.id] = task_id
-        s.commit()
-    return task_ids
+    rows = db_session.exec(
+        update(UploadRequest)
+        .where(col(UploadRequest.status) == "queued")
+        .values(
+            celery_task_id=literal("celery-task-") + cast(col(UploadRequest.id), String)
+        )
+        .returning(col(UploadRequest.id), col(UploadRequest.celery_task_id))
+        .execution_options(synchronize_session=False)
+    ).all()
+    db_session.flush()
+    return dict(rows)
 
 
 @given(parsers.parse("there are {count:d} batches in the system"))
-def step_given_batches_exist(engine, count):
+def step_given_batches_exist(db_session, count):
     """Create multiple batches for testing"""
-    with Session(engine) as s:
-        s.merge(User(userid="12345", username="testuser"))
-        for i in range(1, count + 1):
-            s.merge(Batch(id=i, userid="12345", edit_group_id=f"batch{i:06d}"))
-        s.commit()
+    seed_user(db_session)
+    seed_batches(
+        db_session,
+        [
+            {"id": i, "userid": "12345", "edit_group_id": f"batch{i:06d}"}
+            for i in range(1, count + 1)
+        ],
+    )
+    db_session.flush()
 
 
 @given(parsers.parse('upload requests exist with status "{status}"'))
-def step_given_upload_requests_exist(engine, status):
+def step_given_upload_requests_exist(db_session, default_batch, status):
     """Create multiple upload requests with given status"""
-    with Session(engine) as s:
-        s.merge(User(userid="12345", username="testuser"))
-        s.merge(Batch(id=1, userid="12345", edit_group_id="testbatch12345"))
-        s.commit()
-        for i in range(1, 4):
-            s.add(
-                UploadRequest(
-                    id=i,
-                    batchid=1,
-                    userid="12345",
-                    status=status,
-                    key=f"img{i}",
-                    handler="mapillary",
-                    filename=f"img{i}.jpg",
-                    wikitext="W",
-                    access_token="E",
-                )
-            )
-        s.commit()
+    db_session.exec(
+        insert(UploadRequest),
+        params=[
+            _upload_row(default_batch, status, f"img{i}", id=i) for i in range(1, 4)
+        ],
+    )
+    db_session.flush()
 
 
 @given(
@@ -409,23 +393,7 @@ def step_given_upload_requests_exist(engine, status):
         'an upload request exists with status "{status}" and ID {upload_id:d}'
     )
 )
-def step_given_upload_with_id(engine, status, upload_id):
+def step_given_upload_with_id(db_session, default_batch, status, upload_id):
     """Create an upload request with specific status and ID"""
-    with Session(engine) as s:
-        s.merge(User(userid="12345", username="testuser"))
-        s.merge(Batch(id=1, userid="12345", edit_group_id="testbatch12345"))
-        s.commit()
-        s.add(
-            UploadRequest(
-                id=upload_id,
-                batchid=1,
-                userid="12345",
-                status=status,
-                key=f"img{upload_id}",
-                handler="mapillary",
-                filename=f"img{upload_id}.jpg",
-                wikitext="W",
-                access_token="E",
-            )
-        )
-        s.commit()
+    add_upload(db_session, default_batch, status, f"img{upload_id}", id=upload_id)
+    db_session.flush()
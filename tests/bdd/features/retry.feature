@@ -1,3 +1,4 @@
+@mock_externals
 Feature: Retry Failed Uploads
   As a curator
   I want to retry failed uploads
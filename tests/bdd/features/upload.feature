@@ -1,3 +1,4 @@
+@mock_externals
 Feature: Upload Workflow
   As a curator
   I want to create batches and upload image data
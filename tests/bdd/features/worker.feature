@@ -1,3 +1,4 @@
+@mock_externals
 Feature: Image Ingestion Worker
   As a background system
   I want to process queued upload requests
@@ -1,32 +1,10 @@
 """BDD tests for admin.feature"""
 
-from pytest_bdd import parsers, scenario, then, when
+from pytest_bdd import parsers, scenarios, then, when
 
 # --- Scenarios ---
 
-
-@scenario("features/admin.feature", "Admin can list all batches")
-def test_admin_list_batches():
-    pass
-
-
-@scenario("features/admin.feature", "Non-admin cannot access admin panel")
-def test_admin_no_access():
-    pass
-
-
-@scenario("features/admin.feature", "Admin can list all users")
-def test_admin_list_users():
-    pass
-
-
-@scenario(
-    "features/admin.feature",
-    "Admin users endpoint returns properly serialized user data",
-)
-def test_admin_users_serialization():
-    pass
-
+scenarios("features/admin.feature")
 
 # --- GIVENS ---
 
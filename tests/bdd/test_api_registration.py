@@ -1,30 +1,10 @@
 """BDD tests for api_registration.feature"""
 
-from pytest_bdd import given, scenario, then, when
+from pytest_bdd import given, scenarios, then, when
 
 # --- Scenarios ---
 
-
-@scenario(
-    "features/api_registration.feature", "Successful registration with valid API key"
-)
-def test_api_register_success():
-    pass
-
-
-@scenario(
-    "features/api_registration.feature", "Registration fails with invalid API key"
-)
-def test_api_register_invalid_key():
-    pass
-
-
-@scenario(
-    "features/api_registration.feature", "Registration fails when API key is missing"
-)
-def test_api_register_missing_key():
-    pass
-
+scenarios("features/api_registration.feature")
 
 # --- GIVENS ---
 
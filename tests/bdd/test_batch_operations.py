@@ -1,33 +1,15 @@
 """BDD tests for batch_operations.feature"""
 
-from unittest.mock import MagicMock
+from pytest_bdd import parsers, scenarios, then, when
+from sqlmodel import select
 
-from mwoauth import AccessToken
-from pytest_bdd import parsers, scenario, then, when
-from sqlmodel import Session, select
-
-from curator.core.handler import Handler
 from curator.db.models import UploadRequest
 
-from .conftest import run_sync
+from .conftest_steps import async_to_sync
 
 # --- Scenarios ---
 
-
-@scenario("features/batch_operations.feature", "Fetching uploads for a batch")
-def test_fetch_batch_uploads():
-    pass
-
-
-@scenario("features/batch_operations.feature", "Admin can list all upload requests")
-def test_admin_list_upload_requests():
-    pass
-
-
-@scenario("features/batch_operations.feature", "Admin can update an upload request")
-def test_admin_update_upload_request():
-    pass
-
+scenarios("features/batch_operations.feature")
 
 # --- GIVENS ---
 
@@ -36,17 +18,9 @@ def test_admin_update_upload_request():
 
 
 @when("I fetch uploads for batch 1")
-def when_fetch_batch_uploads(mock_sender, event_loop):
-    h = Handler(
-        {
-            "username": "testuser",
-            "userid": "12345",
-            "access_token": AccessToken("v", "v"),
-        },
-        mock_sender,
-        MagicMock(),
-    )
-    run_sync(h.fetch_batch_uploads(1), event_loop)
+@async_to_sync
+async def when_fetch_batch_uploads(testuser_handler, event_loop):
+    await testuser_handler.fetch_batch_uploads(1)
 
 
 @when("I request the admin list of upload requests", target_fixture="response")
@@ -58,13 +32,12 @@ def when_admin_upload_requests(client):
     parsers.parse('I update the upload request status to "{status}"'),
     target_fixture="response",
 )
-def when_update_upload_request(client, engine):
-    with Session(engine) as s:
-        up = s.exec(
-            select(UploadRequest).where(UploadRequest.key == "updatable_img")
-        ).first()
-        assert up is not None
-        upload_id = up.id
+def when_update_upload_request(client, db_session, u_res):
+    upload_id = db_session.exec(
+        select(UploadRequest.id).where(UploadRequest.key == "updatable_img")
+    ).first()
+    assert upload_id is not None
+    u_res["upload_id"] = upload_id
     return client.put(
         f"/api/admin/upload_requests/{upload_id}", json={"status": "queued"}
     )
@@ -92,10 +65,8 @@ def then_admin_upload_requests_count(response):
 
 
 @then("the upload request should be updated in the database")
-def then_upload_updated(engine):
-    with Session(engine) as s:
-        up = s.exec(
-            select(UploadRequest).where(UploadRequest.key == "updatable_img")
-        ).first()
-        assert up is not None
-        assert up.status == "queued"
+def then_upload_updated(db_session, u_res):
+    # populate_existing so the identity map cannot serve a pre-update copy
+    up = db_session.get(UploadRequest, u_res["upload_id"], populate_existing=True)
+    assert up is not None
+    assert up.status == "queued"
@@ -1,26 +1,12 @@
 """BDD tests for batch_subscription.feature"""
 
-from unittest.mock import MagicMock
+from pytest_bdd import scenarios, then, when
 
-from mwoauth import AccessToken
-from pytest_bdd import scenario, then, when
-
-from curator.core.handler import Handler
-
-from .conftest import run_sync
+from .conftest_steps import async_to_sync
 
 # --- Scenarios ---
 
-
-@scenario("features/batch_subscription.feature", "Subscribing to batch updates")
-def test_subscribe_batch():
-    pass
-
-
-@scenario("features/batch_subscription.feature", "Unsubscribing from batch updates")
-def test_unsubscribe_batch():
-    pass
-
+scenarios("features/batch_subscription.feature")
 
 # --- GIVENS ---
 
@@ -29,31 +15,15 @@ def test_unsubscribe_batch():
 
 
 @when("I subscribe to batch 1")
-def when_subscribe_batch(mock_sender, event_loop):
-    h = Handler(
-        {
-            "username": "testuser",
-            "userid": "12345",
-            "access_token": AccessToken("v", "v"),
-        },
-        mock_sender,
-        MagicMock(),
-    )
-    run_sync(h.subscribe_batch(1), event_loop)
+@async_to_sync
+async def when_subscribe_batch(testuser_handler, event_loop):
+    await testuser_handler.subscribe_batch(1)
 
 
 @when("I unsubscribe from batch updates")
-def when_unsubscribe_batch(mock_sender, event_loop):
-    h = Handler(
-        {
-            "username": "testuser",
-            "userid": "12345",
-            "access_token": AccessToken("v", "v"),
-        },
-        mock_sender,
-        MagicMock(),
-    )
-    run_sync(h.unsubscribe_batch(), event_loop)
+@async_to_sync
+async def when_unsubscribe_batch(testuser_handler, event_loop):
+    await testuser_handler.unsubscribe_batch()
 
 
 # --- THENS ---
@@ -1,107 +1,61 @@
 """BDD tests for cancel.feature"""
 
-import asyncio
-from unittest.mock import AsyncMock, MagicMock
+from unittest.mock import MagicMock
 
-from pytest_bdd import given, parsers, scenario, then, when
-from sqlmodel import Session, col, select
+from pytest_bdd import given, parsers, scenarios, then, when
+from sqlalchemy import func, update
+from sqlmodel import col, select
 
 from curator.asyncapi import CancelBatch
 from curator.core.handler import Handler
 from curator.db.models import UploadRequest
 
-from .conftest import run_sync
+from .conftest_steps import async_to_sync, count_uploads
 
 # --- Scenarios ---
 
-
-@scenario("features/cancel.feature", "Cancel queued uploads via WebSocket")
-def test_cancel_batch_websocket():
-    pass
-
-
-@scenario("features/cancel.feature", "Cancel batch with no queued items")
-def test_cancel_batch_no_queued():
-    pass
-
-
-@scenario("features/cancel.feature", "Cancel batch not owned by user")
-def test_cancel_batch_permission_denied():
-    pass
-
-
-@scenario("features/cancel.feature", "Cancel non-existent batch")
-def test_cancel_batch_not_found():
-    pass
-
-
-@scenario(
-    "features/cancel.feature",
-    "Cancel batch with some queued and some in_progress items",
-)
-def test_cancel_batch_mixed_statuses():
-    pass
-
-
-@scenario("features/cancel.feature", "Cancel batch uploads without task IDs")
-def test_cancel_batch_no_task_ids():
-    pass
-
-
-@scenario("features/cancel.feature", "Admin can cancel any batch")
-def test_admin_cancel_any_batch():
-    pass
-
-
-@scenario("features/cancel.feature", "Admin cancel batch with no queued items")
-def test_admin_cancel_no_queued():
-    pass
-
-
-@scenario("features/cancel.feature", "Admin cancel non-existent batch")
-def test_admin_cancel_not_found():
-    pass
-
-
-@scenario("features/cancel.feature", "Admin cancel batch with mixed statuses")
-def test_admin_cancel_mixed_statuses():
-    pass
-
+scenarios("features/cancel.feature")
 
 # --- GIVENS ---
 
 
 @given("the upload requests do not have Celery task IDs")
-def step_given_no_task_ids(engine):
+def step_given_no_task_ids(db_session):
     """Clear task IDs for existing uploads"""
-    with Session(engine) as s:
-        uploads = s.exec(
-            select(UploadRequest).where(UploadRequest.status == "queued")
-        ).all()
-        for upload in uploads:
-            upload.celery_task_id = None
-        s.commit()
+    db_session.exec(
+        update(UploadRequest)
+        .where(col(UploadRequest.status) == "queued")
+        .values(celery_task_id=None)
+        .execution_options(synchronize_session=False)
+    )
+    db_session.flush()
 
 
 @given(parsers.parse('I manually update one upload to "{status}" status'))
-def step_given_update_one_upload(engine, status):
+def step_given_update_one_upload(db_session, status):
     """Update first queued upload to different status"""
-    with Session(engine) as s:
-        upload = s.exec(
-            select(UploadRequest)
-            .where(UploadRequest.status == "queued")
-            .order_by(col(UploadRequest.id))
-        ).first()
-        if upload:
-            upload.status = status
-            s.commit()
+    first_queued = (
+        select(func.min(UploadRequest.id))
+        .where(UploadRequest.status == "queued")
+        .scalar_subquery()
+    )
+    db_session.exec(
+        update(UploadRequest)
+        .where(col(UploadRequest.id) == first_queued)
+        .values(status=status)
+        .execution_options(synchronize_session=False)
+    )
+    db_session.flush()
 
 
 # --- WHENS ---
 
 
 @when(parsers.parse("I cancel batch {batch_id:d}"))
-def step_when_cancel_batch(batch_id, active_user, mocker, u_res):
+@async_to_sync
+async def step_when_cancel_batch(
+    batch_id, active_user, mocker, mock_sender, u_res, event_loop
+):
     """Send cancel batch message via WebSocket"""
     # Mock the Celery control
     mock_control = mocker.patch("curator.core.handler.celery_app.control")
@@ -109,24 +63,18 @@ def step_when_cancel_batch(batch_id, active_user, mocker, u_res):
     u_res["cancel"] = mock_control
 
     # Create handler and send cancel message
-    mock_sender = MagicMock()
-    mock_sender.send_error = AsyncMock()
     handler = Handler(active_user, mock_sender, MagicMock())
 
     data = CancelBatch(data=batch_id)
-    run_sync(handler.cancel_batch(data.data), asyncio.get_event_loop())
+    await handler.cancel_batch(data.data)
 
 
 # --- THENS ---
 
 
 @then('the upload requests should be marked as "cancelled"')
-def step_then_cancelled_status(engine):
-    with Session(engine) as s:
-        cancelled = s.exec(
-            select(UploadRequest).where(UploadRequest.status == "cancelled")
-        ).all()
-        assert len(cancelled) > 0
+def step_then_cancelled_status(db_session):
+    assert count_uploads(db_session, UploadRequest.status == "cancelled") > 0
 
 
 @then("the Celery tasks should be revoked")
@@ -137,12 +85,8 @@ def step_then_tasks_revoked(u_res):
 
 
 @then("the in_progress upload should remain unchanged")
-def step_then_in_progress_unchanged(engine):
-    with Session(engine) as s:
-        in_progress = s.exec(
-            select(UploadRequest).where(UploadRequest.status == "in_progress")
-        ).first()
-        assert in_progress is not None
+def step_then_in_progress_unchanged(db_session):
+    assert count_uploads(db_session, UploadRequest.status == "in_progress") > 0
 
 
 @then("no Celery tasks should be revoked")
@@ -153,41 +97,30 @@ def step_then_no_tasks_revoked(u_res):
 
 
 @then('the queued upload should be marked as "cancelled"')
-def step_then_queued_cancelled(engine):
-    with Session(engine) as s:
-        cancelled = s.exec(
-            select(UploadRequest).where(
-                UploadRequest.status == "cancelled", UploadRequest.key == "queued_img"
-            )
-        ).first()
-        assert cancelled is not None
+def step_then_queued_cancelled(db_session):
+    assert (
+        count_uploads(
+            db_session,
+            UploadRequest.status == "cancelled",
+            UploadRequest.key == "queued_img",
+        )
+        > 0
+    )
 
 
 @then('the in_progress upload should remain "in_progress"')
-def step_then_progress_remains(engine):
-    with Session(engine) as s:
-        in_progress = s.exec(
-            select(UploadRequest).where(UploadRequest.status == "in_progress")
-        ).first()
-        assert in_progress is not None
+def step_then_progress_remains(db_session):
+    assert count_uploads(db_session, UploadRequest.status == "in_progress") > 0
 
 
 @then(parsers.parse('{count:d} upload should be marked as "{status}"'))
-def step_then_count_status(engine, count, status):
-    with Session(engine) as s:
-        uploads = s.exec(
-            select(UploadRequest).where(UploadRequest.status == status)
-        ).all()
-        assert len(uploads) == count
+def step_then_count_status(db_session, count, status):
+    assert count_uploads(db_session, UploadRequest.status == status) == count
 
 
 @then(parsers.parse('{count:d} upload should remain "{status}"'))
-def step_then_count_remain(engine, count, status):
-    with Session(engine) as s:
-        uploads = s.exec(
-            select(UploadRequest).where(UploadRequest.status == status)
-        ).all()
-        assert len(uploads) == count
+def step_then_count_remain(db_session, count, status):
+    assert count_uploads(db_session, UploadRequest.status == status) == count
 
 
 @then("the Celery task for the cancelled upload should be revoked")
@@ -2,24 +2,16 @@
 
 from unittest.mock import MagicMock
 
-from mwoauth import AccessToken
-from pytest_bdd import scenario, then, when
+from pytest_bdd import scenarios, then, when
 
-from curator.core.handler import Handler
+from .conftest_steps import async_to_sync
 
-from .conftest_steps import run_sync
-
-
-@scenario(
-    "features/check_categories_deleted.feature",
-    "Some categories are deleted, others are not",
-)
-def test_check_categories_deleted():
-    pass
+scenarios("features/check_categories_deleted.feature")
 
 
 @when('I check if categories "Foo" and "Bar" are deleted and "Foo" is deleted')
-def when_check_categories_deleted(mock_sender, event_loop, mocker):
+@async_to_sync
+async def when_check_categories_deleted(testuser_handler, event_loop, mocker):
     def _is_deleted(title: str) -> bool:
         return title == "Foo"
 
@@ -30,16 +22,7 @@ def when_check_categories_deleted(mock_sender, event_loop, mocker):
         return_value=mock_mw,
         create=True,
     )
-    h = Handler(
-        {
-            "username": "testuser",
-            "userid": "12345",
-            "access_token": AccessToken("v", "s"),
-        },
-        mock_sender,
-        MagicMock(),
-    )
-    run_sync(h.check_categories_deleted(["Foo", "Bar"]), event_loop)
+    await testuser_handler.check_categories_deleted(["Foo", "Bar"])
 
 
 @then('I should receive a categories deleted response with "Foo" in the deleted list')
@@ -6,7 +6,7 @@ from pathlib import Path
 import pytest
 import requests
 from mwoauth import AccessToken
-from pytest_bdd import given, parsers, scenario, then, when
+from pytest_bdd import given, parsers, scenarios, then, when
 
 from curator.core.errors import DuplicateUploadError
 from curator.mediawiki.client import MediaWikiClient
@@ -44,45 +44,7 @@ def _chunk3_dbqueryerror_then_stashfailed_mock(
 
 # --- Scenarios ---
 
-
-@scenario(
-    "features/chunk_upload_retry.feature", "Chunk upload succeeds on first attempt"
-)
-def test_chunk_upload_success_first_attempt():
-    pass
-
-
-@scenario(
-    "features/chunk_upload_retry.feature", "Chunk upload retries once on 502 error"
-)
-def test_chunk_upload_retry_on_502():
-    pass
-
-
-@scenario("features/chunk_upload_retry.feature", "Chunk upload fails after max retries")
-def test_chunk_upload_fails_after_max_retries():
-    pass
-
-
-@scenario("features/chunk_upload_retry.feature", "Chunk upload retry on timeout")
-def test_chunk_upload_retry_on_timeout():
-    pass
-
-
-@scenario(
-    "features/chunk_upload_retry.feature",
-    "Chunk 3 stashfailed already-completed after DBQueryError proceeds to final commit",
-)
-def test_chunk3_stashfailed_already_completed_proceeds_to_commit():
-    pass
-
-
-@scenario(
-    "features/chunk_upload_retry.feature", "Duplicate error does not trigger retry"
-)
-def test_duplicate_error_no_retry():
-    pass
-
+scenarios("features/chunk_upload_retry.feature")
 
 # --- GIVENS ---
 
@@ -1,66 +1,35 @@
 """BDD tests for mapillary_handler.feature"""
 
 import pytest
-from pytest_bdd import given, parsers, scenario, then, when
+from pytest_bdd import given, parsers, scenarios, then, when
 
 from curator.handlers.mapillary_handler import from_mapillary
 
 # --- Scenarios ---
 
-
-@scenario("features/mapillary_handler.feature", 'Mapillary sends "none" as camera make')
-def test_mapillary_none_as_camera_make():
-    pass
-
-
-@scenario(
-    "features/mapillary_handler.feature", 'Mapillary sends "none" as camera model'
-)
-def test_mapillary_none_as_camera_model():
-    pass
-
-
-@scenario(
-    "features/mapillary_handler.feature", "Mapillary sends valid camera make and model"
-)
-def test_mapillary_valid_camera_make_and_model():
-    pass
-
-
-@scenario(
-    "features/mapillary_handler.feature",
-    "Mapillary sends missing camera make and model",
-)
-def test_mapillary_missing_camera_make_and_model():
-    pass
-
-
-@scenario(
-    "features/mapillary_handler.feature",
-    'Mapillary sends "none" for both camera make and model',
-)
-def test_mapillary_none_for_both_camera_make_and_model():
-    pass
-
+scenarios("features/mapillary_handler.feature")
 
 # --- GIVENS ---
 
+_MAPILLARY_RESPONSE = {
+    "id": "123",
+    "geometry": {"coordinates": [10, 20]},
+    "creator": {"id": "u1", "username": "user1"},
+    "captured_at": 1600000000000,
+    "compass_angle": 180,
+    "thumb_original_url": "http://original",
+    "thumb_256_url": "http://thumb",
+    "thumb_1024_url": "http://preview",
+    "width": 100,
+    "height": 100,
+    "is_pano": False,
+}
+
 
 @pytest.fixture
 def mapillary_response():
-    return {
-        "id": "123",
-        "geometry": {"coordinates": [10, 20]},
-        "creator": {"id": "u1", "username": "user1"},
-        "captured_at": 1600000000000,
-        "compass_angle": 180,
-        "thumb_original_url": "http://original",
-        "thumb_256_url": "http://thumb",
-        "thumb_1024_url": "http://preview",
-        "width": 100,
-        "height": 100,
-        "is_pano": False,
-    }
+    # Steps only set top-level keys, so a shallow copy keeps scenarios apart
+    return _MAPILLARY_RESPONSE.copy()
 
 
 @given(
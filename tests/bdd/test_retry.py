@@ -4,45 +4,17 @@ import json
 from unittest.mock import MagicMock
 
 import pytest
-from mwoauth import AccessToken
-from pytest_bdd import parsers, scenario, then, when
-from sqlmodel import Session, select
+from pytest_bdd import parsers, scenarios, then, when
+from sqlmodel import col, select
 
-from curator.admin import check_admin
-from curator.core.auth import check_login
 from curator.core.handler import Handler
 from curator.db.models import UploadRequest
-from curator.main import app
 
-from .conftest import run_sync
+from .conftest_steps import _FAKE_TOKEN, async_to_sync, auth_overrides, count_uploads
 
 # --- Scenarios ---
 
-
-@scenario("features/retry.feature", "Retrying failed uploads via WebSocket")
-def test_retry_uploads_websocket():
-    pass
-
-
-@scenario("features/retry.feature", "Admin can retry selected upload IDs")
-def test_admin_retry_selected_uploads():
-    pass
-
-
-@scenario("features/retry.feature", "Admin retry ignores in_progress uploads")
-def test_admin_retry_ignores_in_progress():
-    pass
-
-
-@scenario("features/retry.feature", "Admin retry ignores non-existent IDs")
-def test_admin_retry_ignores_nonexistent():
-    pass
-
-
-@scenario("features/retry.feature", "Admin retry with empty list")
-def test_admin_retry_empty_list():
-    pass
-
+scenarios("features/retry.feature")
 
 # --- FIXTURES ---
 
@@ -54,14 +26,14 @@ def admin_user():
         "username": "DaxServer",
         "userid": "admin123",
         "sub": "admin123",
-        "access_token": AccessToken("v", "s"),
+        "access_token": _FAKE_TOKEN,
     }
 
 
-def _setup_admin_dependencies(app, admin_user):
+def _setup_admin_dependencies(admin_user):
     """Setup admin dependency overrides"""
-    app.dependency_overrides[check_login] = lambda: admin_user
-    app.dependency_overrides[check_admin] = lambda: None
+    auth_overrides["user"] = admin_user
+    auth_overrides["check_admin"] = lambda: None
 
 
 # --- GIVENS ---
@@ -71,7 +43,8 @@ def _setup_admin_dependencies(app, admin_user):
 
 
 @when(parsers.parse("I retry uploads for batch {batch_id:d}"))
-def when_retry_uploads(active_user, mock_sender, batch_id, event_loop, mocker):
+@async_to_sync
+async def when_retry_uploads(active_user, mock_sender, batch_id, event_loop, mocker):
     mock_apply_async = mocker.patch(
         "curator.core.task_enqueuer.process_upload.apply_async"
     )
@@ -84,7 +57,7 @@ def when_retry_uploads(active_user, mock_sender, batch_id, event_loop, mocker):
         return_value=0.0,
     )
     h = Handler(active_user, mock_sender, MagicMock())
-    run_sync(h.retry_uploads(batch_id), event_loop)
+    await h.retry_uploads(batch_id)
     return {"apply_async": mock_apply_async}
 
 
@@ -93,7 +66,7 @@ def when_retry_uploads(active_user, mock_sender, batch_id, event_loop, mocker):
     target_fixture="admin_retry_result",
 )
 def when_admin_retry(client, ids, mocker, admin_user):
-    _setup_admin_dependencies(app, admin_user)
+    _setup_admin_dependencies(admin_user)
     mock_apply_async = mocker.patch("curator.workers.tasks.process_upload.apply_async")
     upload_ids = json.loads(ids)
     response = client.post("/api/admin/retry", json={"upload_ids": upload_ids})
@@ -105,7 +78,7 @@ def when_admin_retry(client, ids, mocker, admin_user):
     target_fixture="admin_retry_result",
 )
 def when_admin_retry_empty(client, mocker, admin_user):
-    _setup_admin_dependencies(app, admin_user)
+    _setup_admin_dependencies(admin_user)
     mock_apply_async = mocker.patch("curator.workers.tasks.process_upload.apply_async")
     response = client.post("/api/admin/retry", json={"upload_ids": []})
     return {"response": response, "apply_async": mock_apply_async}
@@ -115,20 +88,16 @@ def when_admin_retry_empty(client, mocker, admin_user):
 
 
 @then(parsers.parse('the upload requests should be reset to "{status}" status'))
-def then_reset_status(engine, status):
-    with Session(engine) as s:
-        original_uploads = s.exec(
-            select(UploadRequest).where(
-                UploadRequest.userid == "12345", UploadRequest.batchid == 1
-            )
-        ).all()
-        for up in original_uploads:
-            assert up.status == "failed"
-
-        queued_uploads = s.exec(
-            select(UploadRequest).where(UploadRequest.status == status)
-        ).all()
-        assert len(queued_uploads) > 0
+def then_reset_status(db_session, status):
+    original_statuses = db_session.exec(
+        select(col(UploadRequest.status)).where(
+            UploadRequest.userid == "12345", UploadRequest.batchid == 1
+        )
+    ).all()
+    for original_status in original_statuses:
+        assert original_status == "failed"
+
+    assert count_uploads(db_session, UploadRequest.status == status) > 0
 
 
 @then("I should receive a confirmation with the number of retries")
@@ -149,11 +118,11 @@ def then_selected_uploads_queued(admin_retry_result):
 
 
 @then(parsers.parse("upload ID {upload_id:d} should remain in_progress"))
-def then_remains_in_progress(engine, upload_id):
-    with Session(engine) as s:
-        up = s.get(UploadRequest, upload_id)
-        assert up is not None
-        assert up.status == "in_progress"
+def then_remains_in_progress(db_session, upload_id):
+    up_status = db_session.exec(
+        select(col(UploadRequest.status)).where(UploadRequest.id == upload_id)
+    ).one()
+    assert up_status == "in_progress"
 
 
 @then(
@@ -169,17 +138,18 @@ def then_retry_count(admin_retry_result, retried, requested):
 
 
 @then(parsers.parse("only upload ID {upload_id:d} should be queued"))
-def then_specific_upload_queued(engine, upload_id):
-    with Session(engine) as s:
-        original_up = s.get(UploadRequest, upload_id)
-        assert original_up is not None
-        assert original_up.status == "failed"
-
-        queued_uploads = s.exec(
-            select(UploadRequest).where(UploadRequest.status == "queued")
-        ).all()
-        assert len(queued_uploads) == 1
-        assert queued_uploads[0].key == original_up.key
+def then_specific_upload_queued(db_session, upload_id):
+    original_status, original_key = db_session.exec(
+        select(col(UploadRequest.status), col(UploadRequest.key)).where(
+            UploadRequest.id == upload_id
+        )
+    ).one()
+    assert original_status == "failed"
+
+    queued_keys = db_session.exec(
+        select(col(UploadRequest.key)).where(UploadRequest.status == "queued")
+    ).all()
+    assert queued_keys == [original_key]
 
 
 @then("the response should indicate 0 retried")
@@ -1,29 +1,16 @@
 """BDD tests for streaming.feature"""
 
 import asyncio
-from unittest.mock import MagicMock
 
-from mwoauth import AccessToken
-from pytest_bdd import parsers, scenario, then, when
+from pytest_bdd import parsers, scenarios, then, when
 
 from curator.asyncapi import FetchBatchesData
-from curator.core.auth import UserSession
-from curator.core.handler import Handler
 
-from .conftest import run_sync
+from .conftest_steps import async_to_sync
 
 # --- Scenarios ---
 
-
-@scenario("features/streaming.feature", "Initial sync of batches")
-def test_streaming_sync_scenario():
-    pass
-
-
-@scenario("features/streaming.feature", "Fetching batches with cancelled uploads")
-def test_fetch_batches_with_cancelled():
-    pass
-
+scenarios("features/streaming.feature")
 
 # --- GIVENS ---
 
@@ -32,23 +19,17 @@ def test_fetch_batches_with_cancelled():
 
 
 @when("I request to fetch my batches")
-def when_streaming(mock_sender, event_loop, mocker):
+@async_to_sync
+async def when_streaming(testuser_handler, mock_sender, event_loop, mocker):
     mocker.patch(
         "curator.core.handler.asyncio.sleep",
         side_effect=[None, asyncio.CancelledError],
     )
 
     data = FetchBatchesData(userid="12345", filter=None, page=1, limit=100)
-    h = Handler(
-        UserSession(
-            username="testuser", userid="12345", access_token=AccessToken("v", "v")
-        ),
-        mock_sender,
-        MagicMock(),
-    )
-    run_sync(h.fetch_batches(data), event_loop)
-    assert h.batches_list_task is not None
-    run_sync(asyncio.wait_for(h.batches_list_task, 1), event_loop)
+    await testuser_handler.fetch_batches(data)
+    assert testuser_handler.batches_list_task is not None
+    await asyncio.wait_for(testuser_handler.batches_list_task, 1)
     return mock_sender
 
 
@@ -73,42 +54,37 @@ def then_stream_total(mock_sender, count):
     assert mock_sender.send_batches_list.call_args_list[0].args[0].total == count
 
 
+def _find_batch(mock_sender, batch_id):
+    """First batch with batch_id across the send_batches_list calls, or None"""
+    return next(
+        (
+            batch
+            for call in mock_sender.send_batches_list.call_args_list
+            for batch in call.args[0].items
+            if batch.id == batch_id
+        ),
+        None,
+    )
+
+
 @then(parsers.parse("the batch stats should include {count:d} cancelled upload"))
 def step_then_batch_stats_cancelled(mock_sender, count):
     """Verify batch stats in API response include cancelled count"""
-    # Find the batch with id=1 in the response
-    batch_found = False
-    for call in mock_sender.send_batches_list.call_args_list:
-        batches_list = call.args[0]  # BatchesListData
-        for batch in batches_list.items:
-            if batch.id == 1:
-                assert batch.stats.cancelled == count
-                batch_found = True
-                break
-        if batch_found:
-            break
-    assert batch_found, "Batch with id=1 not found in response"
+    batch = _find_batch(mock_sender, 1)
+    assert batch is not None, "Batch with id=1 not found in response"
+    assert batch.stats.cancelled == count
 
 
 @then("the batch stats should be accurate")
-def step_then_batch_stats_accurate(mock_sender, engine):
+def step_then_batch_stats_accurate(mock_sender):
     """Verify all batch stats in API response are accurate"""
-    # Find the batch with id=1 in the response
-    batch_found = False
-    for call in mock_sender.send_batches_list.call_args_list:
-        batches_list = call.args[0]  # BatchesListData
-        for batch in batches_list.items:
-            if batch.id == 1:
-                stats = batch.stats
-                assert stats.total == 3
-                assert stats.completed == 1
-                assert stats.queued == 1
-                assert stats.cancelled == 1
-                assert stats.failed == 0
-                assert stats.in_progress == 0
-                assert stats.duplicate == 0
-                batch_found = True
-                break
-        if batch_found:
-            break
-    assert batch_found, "Batch with id=1 not found in response"
+    batch = _find_batch(mock_sender, 1)
+    assert batch is not None, "Batch with id=1 not found in response"
+    stats = batch.stats
+    assert stats.total == 3
+    assert stats.completed == 1
+    assert stats.queued == 1
+    assert stats.cancelled == 1
+    assert stats.failed == 0
+    assert stats.in_progress == 0
+    assert stats.duplicate == 0
@@ -2,28 +2,18 @@
 
 from unittest.mock import MagicMock
 
-from pytest_bdd import parsers, scenario, then, when
-from sqlmodel import Session, select
+from pytest_bdd import parsers, scenarios, then, when
 
 from curator.asyncapi import UploadItem, UploadSliceData
 from curator.core.handler import Handler
 from curator.core.rate_limiter import RateLimitInfo
 from curator.db.models import Batch, UploadRequest
 
-from .conftest import run_sync
+from .conftest_steps import async_to_sync, count_uploads
 
 # --- Scenarios ---
 
-
-@scenario("features/upload.feature", "Creating a new batch")
-def test_create_batch_scenario():
-    pass
-
-
-@scenario("features/upload.feature", "Uploading multiple images to a batch")
-def test_upload_slice_scenario():
-    pass
-
+scenarios("features/upload.feature")
 
 # --- GIVENS ---
 
@@ -32,9 +22,10 @@ def test_upload_slice_scenario():
 
 
 @when("I request to create a new batch", target_fixture="created_batch_id")
-def when_create(active_user, mock_sender, event_loop):
+@async_to_sync
+async def when_create(active_user, mock_sender, event_loop):
     h = Handler(active_user, mock_sender, MagicMock())
-    run_sync(h.create_batch(), event_loop)
+    await h.create_batch()
     return mock_sender.send_batch_created.call_args[0][0]
 
 
@@ -42,7 +33,8 @@ def when_create(active_user, mock_sender, event_loop):
     parsers.parse("I upload a slice with {count:d} images to batch {batch_id:d}"),
     target_fixture="u_res",
 )
-def when_upload(active_user, mock_sender, count, batch_id, mocker, event_loop):
+@async_to_sync
+async def when_upload(active_user, mock_sender, count, batch_id, mocker, event_loop):
     # Mock process_upload and rate limiter functions
     mock_process = mocker.patch("curator.core.task_enqueuer.process_upload")
     mock_process.delay = mocker.MagicMock()
@@ -58,15 +50,18 @@ def when_upload(active_user, mock_sender, count, batch_id, mocker, event_loop):
     )
     mock_get_delay.return_value = 0.0
 
+    # Trusted literals; model_construct skips pydantic validation per item
     items = [
-        UploadItem(id=f"img{i}", input=f"in{i}", title=f"T{i}", wikitext="W")
+        UploadItem.model_construct(
+            id=f"img{i}", input=f"in{i}", title=f"T{i}", wikitext="W"
+        )
         for i in range(count)
     ]
-    data = UploadSliceData(
+    data = UploadSliceData.model_construct(
         batchid=batch_id, sliceid=1, handler="mapillary", items=items
     )
     h = Handler(active_user, mock_sender, MagicMock())
-    run_sync(h.upload_slice(data), event_loop)
+    await h.upload_slice(data)
     return {"delay": mock_process.delay, "apply_async": mock_process.apply_async}
 
 
@@ -74,11 +69,10 @@ def when_upload(active_user, mock_sender, count, batch_id, mocker, event_loop):
 
 
 @then("a new batch should exist in the database for my user")
-def then_batch_exists(engine, active_user, created_batch_id):
-    with Session(engine) as s:
-        b = s.exec(select(Batch).where(Batch.id == created_batch_id)).first()
-        assert b is not None
-        assert b.userid == active_user["userid"]
+def then_batch_exists(db_session, active_user, created_batch_id):
+    b = db_session.get(Batch, created_batch_id)
+    assert b is not None
+    assert b.userid == active_user["userid"]
 
 
 @then("I should receive a message with the new batch id")
@@ -87,12 +81,11 @@ def then_batch_msg(mock_sender, created_batch_id):
 
 
 @then("the batch should have an edit_group_id")
-def then_batch_has_edit_group_id(engine, created_batch_id):
-    with Session(engine) as s:
-        b = s.get(Batch, created_batch_id)
-        assert b is not None
-        assert b.edit_group_id is not None
-        assert len(b.edit_group_id) == 12
+def then_batch_has_edit_group_id(db_session, created_batch_id):
+    b = db_session.get(Batch, created_batch_id)
+    assert b is not None
+    assert b.edit_group_id is not None
+    assert len(b.edit_group_id) == 12
 
 
 @then(
@@ -100,12 +93,8 @@ def then_batch_has_edit_group_id(engine, created_batch_id):
         "{count:d} upload requests should be created in the database for batch {batch_id:d}"
     )
 )
-def then_req_count(engine, count, batch_id):
-    with Session(engine) as s:
-        ups = s.exec(
-            select(UploadRequest).where(UploadRequest.batchid == batch_id)
-        ).all()
-        assert len(ups) == count
+def then_req_count(db_session, count, batch_id):
+    assert count_uploads(db_session, UploadRequest.batchid == batch_id) == count
 
 
 @then(
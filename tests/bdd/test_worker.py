@@ -1,32 +1,19 @@
 """BDD tests for worker.feature"""
 
-from pytest_bdd import given, parsers, scenario, then, when
-from sqlmodel import Session, col, select
+from pytest_bdd import given, parsers, scenarios, then, when
+from sqlmodel import col, select
 
 from curator.asyncapi import ErrorLink
-from curator.db.models import Batch, UploadRequest, User
+from curator.db.models import Batch, UploadRequest
 from curator.mediawiki.commons import DuplicateUploadError
 from curator.workers.ingest import process_one
 
-from .conftest import run_sync
+from .conftest_db import seed_user
+from .conftest_steps import add_upload, async_to_sync, count_uploads
 
 # --- Scenarios ---
 
-
-@scenario("features/worker.feature", "Successfully processing a queued upload")
-def test_worker_processing_scenario():
-    pass
-
-
-@scenario("features/worker.feature", "Handling a blacklisted title")
-def test_worker_blacklist_scenario():
-    pass
-
-
-@scenario("features/worker.feature", "Handling a duplicate upload with SDC merge")
-def test_worker_duplicate_scenario():
-    pass
-
+scenarios("features/worker.feature")
 
 # --- GIVENS ---
 
@@ -53,102 +40,74 @@ def step_given_dup(mocker):
 @given(
     parsers.parse('an upload request exists with status "{status}" and title "{title}"')
 )
-def step_given_upload_title(engine, status, title):
-    with Session(engine) as s:
-        s.merge(User(userid="12345", username="testuser"))
-        b = Batch(userid="12345", edit_group_id="testbatch12345")
-        s.add(b)
-        s.commit()
-        s.refresh(b)
-        s.add(
-            UploadRequest(
-                batchid=b.id,
-                userid="12345",
-                status=status,
-                key="img-t",
-                handler="mapillary",
-                filename=title,
-                wikitext="W",
-                access_token="E",
-            )
-        )
-        s.commit()
+def step_given_upload_title(db_session, status, title):
+    seed_user(db_session)
+    b = Batch(userid="12345", edit_group_id="testbatch12345")
+    db_session.add(b)
+    db_session.flush()
+    add_upload(db_session, b.id, status, "img-t", filename=title)
+    db_session.flush()
 
 
 # --- WHENS ---
 
 
 @when("the ingestion worker processes this upload request")
-def when_worker(engine, event_loop):
-    with Session(engine) as s:
-        up = s.exec(
-            select(UploadRequest).where(UploadRequest.status == "queued")
-        ).first()
-        assert up is not None
-        uid = up.id
-    run_sync(process_one(uid, "test_edit_group_abc123"), event_loop)
+@async_to_sync
+async def when_worker(db_session, event_loop):
+    uid = db_session.exec(
+        select(col(UploadRequest.id)).where(UploadRequest.status == "queued")
+    ).first()
+    assert uid is not None
+    await process_one(uid, "test_edit_group_abc123")
 
 
 # --- THENS ---
 
 
 @then('the upload status should be updated to "completed" in the database')
-def then_worker_completed(engine):
-    with Session(engine) as s:
-        u = s.exec(
-            select(UploadRequest).where(UploadRequest.status == "completed")
-        ).first()
-        assert u is not None
+def then_worker_completed(db_session):
+    assert count_uploads(db_session, UploadRequest.status == "completed") > 0
 
 
 @then("the success URL should be recorded for the request")
-def then_worker_success(engine):
-    with Session(engine) as s:
-        u = s.exec(
-            select(UploadRequest).where(UploadRequest.status == "completed")
-        ).first()
-        assert isinstance(u, UploadRequest)
-        assert u.success is not None
+def then_worker_success(db_session):
+    success = db_session.exec(
+        select(UploadRequest.success).where(UploadRequest.status == "completed")
+    ).first()
+    assert success is not None
 
 
 @then("the access token for this request should be cleared for security")
-def then_token_cleared(engine):
-    with Session(engine) as s:
-        u = s.exec(
-            select(UploadRequest).where(UploadRequest.status == "completed")
-        ).first()
-        assert isinstance(u, UploadRequest)
-        assert u.access_token is None
+def then_token_cleared(db_session):
+    # Select the id too, so a missing row is not mistaken for a NULL token
+    row = db_session.exec(
+        select(UploadRequest.id, UploadRequest.access_token).where(
+            UploadRequest.status == "completed"
+        )
+    ).first()
+    assert row is not None
+    assert row.access_token is None
 
 
 @then('the upload status should be updated to "failed"')
-def then_worker_failed(engine):
-    with Session(engine) as s:
-        u = s.exec(
-            select(UploadRequest).where(UploadRequest.status == "failed")
-        ).first()
-        assert u is not None
+def then_worker_failed(db_session):
+    assert count_uploads(db_session, UploadRequest.status == "failed") > 0
 
 
 @then(parsers.parse('the error message should include "{text}"'))
-def then_worker_err(engine, text):
-    with Session(engine) as s:
-        u = s.exec(
-            select(UploadRequest).where(UploadRequest.status == "failed")
-        ).first()
-        assert isinstance(u, UploadRequest)
-        assert text.lower() in str(u.error).lower()
+def then_worker_err(db_session, text):
+    error = db_session.exec(
+        select(col(UploadRequest.error)).where(UploadRequest.status == "failed")
+    ).first()
+    assert text.lower() in str(error).lower()
 
 
 @then("the SDC should be merged with the existing file")
 @then(parsers.parse('the upload status should be "{status1}" or "{status2}"'))
 def then_dup_merge(
-    engine, status1="duplicated_sdc_updated", status2="duplicated_sdc_not_updated"
+    db_session, status1="duplicated_sdc_updated", status2="duplicated_sdc_not_updated"
 ):
-    with Session(engine) as s:
-        u = s.exec(
-            select(UploadRequest).where(
-                col(UploadRequest.status).in_([status1, status2])
-            )
-        ).first()
-        assert u is not None
+    assert (
+        count_uploads(db_session, col(UploadRequest.status).in_([status1, status2])) > 0
+    )
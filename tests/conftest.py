@@ -11,3 +11,16 @@ if tests_dir not in sys.path:
     sys.path.insert(0, tests_dir)
 
 from fixtures import *  # noqa: E402, F403, F406
+
+
+def pytest_collection_modifyitems(items):
+    """Request mock_external_calls for tests marked (or Gherkin-tagged) mock_externals
+
+    Inserted first, as an autouse fixture would be, so a test's own patch
+    fixtures still override the blanket mocks.
+    """
+    for item in items:
+        if item.get_closest_marker("mock_externals") is None:
+            continue
+        if "mock_external_calls" not in item.fixturenames:
+            item.fixturenames.insert(0, "mock_external_calls")
@@ -2,10 +2,12 @@
 
 import asyncio
 import os
+import weakref
 from contextlib import contextmanager
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
+import pytest_asyncio
 from cryptography.fernet import Fernet
 from fastapi import Request, status
 from fastapi.exceptions import HTTPException
@@ -204,28 +206,34 @@ def mock_requests_response():
     return response
 
 
+_SENDER_METHODS = (
+    "send_batches_list",
+    "send_batch_items",
+    "send_batch_uploads",
+    "send_batch_uploads_list",
+    "send_collection_images",
+    "send_upload_created",
+    "send_subscribed",
+    "send_uploads_update",
+    "send_uploads_complete",
+    "send_upload_slice_ack",
+    "send_batch_created",
+    "send_cancel_batch_ack",
+    "send_error",
+    "send_retry_uploads_response",
+    "send_presets_list",
+    "send_categories_deleted_response",
+    "send_category_created_response",
+    "send_recategorize_files_response",
+)
+
+
 @pytest.fixture
 def mock_sender():
     """Comprehensive mock WebSocket sender covering all AsyncAPI messages"""
     sender = MagicMock()
-    sender.send_batches_list = AsyncMock()
-    sender.send_batch_items = AsyncMock()
-    sender.send_batch_uploads = AsyncMock()
-    sender.send_batch_uploads_list = AsyncMock()
-    sender.send_collection_images = AsyncMock()
-    sender.send_upload_created = AsyncMock()
-    sender.send_subscribed = AsyncMock()
-    sender.send_uploads_update = AsyncMock()
-    sender.send_uploads_complete = AsyncMock()
-    sender.send_upload_slice_ack = AsyncMock()
-    sender.send_batch_created = AsyncMock()
-    sender.send_cancel_batch_ack = AsyncMock()
-    sender.send_error = AsyncMock()
-    sender.send_retry_uploads_response = AsyncMock()
-    sender.send_presets_list = AsyncMock()
-    sender.send_categories_deleted_response = AsyncMock()
-    sender.send_category_created_response = AsyncMock()
-    sender.send_recategorize_files_response = AsyncMock()
+    for name in _SENDER_METHODS:
+        setattr(sender, name, AsyncMock())
     return sender
 
 
@@ -235,6 +243,7 @@ def handler_instance(mocker, mock_user, mock_sender, patch_get_session):
     from curator.core.handler import Handler
 
     patch_get_session("curator.core.handler.get_session")
+    patch_get_session("curator.core.task_enqueuer.get_session")
     return Handler(mock_user, mock_sender, mocker.MagicMock())
 
 
@@ -363,41 +372,43 @@ def patch_clear_upload_access_token(mocker):
 # =============================================================================
 
 
-@pytest.fixture(scope="session")
-def event_loop():
-    """Event loop for BDD tests"""
-    loop = asyncio.get_event_loop_policy().new_event_loop()
-    yield loop
-    loop.close()
+_MEDIA_IMAGE = MediaImage(
+    id="m1",
+    title="T",
+    dates=Dates(taken="2023"),
+    creator=Creator(id="u", username="u", profile_url="p"),
+    location=GeoLocation(latitude=1, longitude=2),
+    urls=ImageUrls(url="u", original="o", preview="p", thumbnail="t"),
+    dimensions=ImageDimensions(width=1, height=1),
+    camera=CameraInfo(make=None, model=None, is_pano=False),
+    existing=[],
+)
+_DECRYPTED_TOKEN = AccessToken("v", "s")
 
 
-def run_sync(coro, loop):
-    """Run coroutine synchronously for BDD tests"""
-    return loop.run_until_complete(coro)
+# Tasks created on the session loop, so teardown need not scan asyncio.all_tasks
+_loop_tasks: weakref.WeakSet[asyncio.Task] = weakref.WeakSet()
 
 
-@pytest.fixture(autouse=True)
-def mock_external_calls(mocker, request):
-    """Auto-use fixture to mock external calls in BDD tests
-
-    Skipped for mediawiki_api unit tests to avoid multiprocessing issues
-    """
-    # Skip this fixture for mediawiki_api and geocoding tests to avoid celery import issues
-    # Check both the test node name and the parent module/file
-    node_name = request.node.name
-    module_name = request.module.__name__ if request.module else ""
-
-    if (
-        "mediawiki" in node_name.lower()
-        or "mediawiki" in module_name.lower()
-        or "geocoding" in module_name.lower()
-        or "test_download" in module_name.lower()
-        or "wikidata_client" in module_name.lower()
-        or "test_admin" in module_name.lower()
-        or "recategorize" in module_name.lower()
-    ):
-        return
+def _tracking_task_factory(loop, coro, **kwargs):
+    task = asyncio.Task(coro, loop=loop, **kwargs)
+    _loop_tasks.add(task)
+    return task
 
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def event_loop():
+    """pytest-asyncio's session loop, for sync BDD steps to run coroutines on"""
+    loop = asyncio.get_running_loop()
+    previous_factory = loop.get_task_factory()
+    loop.set_task_factory(_tracking_task_factory)
+    yield loop
+    loop.set_task_factory(previous_factory)
+
+
+@pytest.fixture
+def mock_external_calls(mocker):
+    """Mock ingest/auth external calls; opt in with the mock_externals marker"""
     mock_client = mocker.MagicMock()
     mock_client.check_title_blacklisted.return_value = (False, "")
     mocker.patch("curator.workers.ingest.MediaWikiClient", return_value=mock_client)
@@ -408,25 +419,13 @@ def mock_external_calls(mocker, request):
     mocker.patch("curator.core.handler.encrypt_access_token", return_value="e")
     mocker.patch(
         "curator.workers.ingest.decrypt_access_token",
-        return_value=AccessToken("v", "s"),
+        return_value=_DECRYPTED_TOKEN,
     )
     mocker.patch(
-        "curator.core.handler.decrypt_access_token", return_value=AccessToken("v", "s")
+        "curator.core.handler.decrypt_access_token", return_value=_DECRYPTED_TOKEN
     )
     mock_h = mocker.patch("curator.workers.ingest.MapillaryHandler").return_value
-    mock_h.fetch_image_metadata = AsyncMock(
-        return_value=MediaImage(
-            id="m1",
-            title="T",
-            dates=Dates(taken="2023"),
-            creator=Creator(id="u", username="u", profile_url="p"),
-            location=GeoLocation(latitude=1, longitude=2),
-            urls=ImageUrls(url="u", original="o", preview="p", thumbnail="t"),
-            dimensions=ImageDimensions(width=1, height=1),
-            camera=CameraInfo(make=None, model=None, is_pano=False),
-            existing=[],
-        )
-    )
+    mock_h.fetch_image_metadata = AsyncMock(return_value=_MEDIA_IMAGE)
     mocker.patch(
         "curator.workers.ingest.build_statements_from_mapillary_image", return_value=[]
     )
@@ -444,8 +443,8 @@ def cleanup_pending_tasks(event_loop):
     """Auto-cleanup pending asyncio tasks after each test to prevent 'Task was destroyed but it is pending' warnings"""
     yield
     # Based on: https://github.com/pytest-dev/pytest-asyncio/issues/435
-    # Collect all tasks and cancel those that are not 'done'
-    tasks = [t for t in asyncio.all_tasks(event_loop) if not t.done()]
+    # Cancel tracked tasks that are not 'done'
+    tasks = [t for t in _loop_tasks if not t.done()]
     for task in tasks:
         task.cancel()
 
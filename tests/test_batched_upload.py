@@ -6,6 +6,7 @@ import pytest
 
 from curator.asyncapi import UploadItem, UploadSliceAckItem, UploadSliceData
 from curator.core.rate_limiter import RateLimitInfo
+from curator.db.models import Batch
 
 
 @pytest.mark.asyncio
@@ -14,8 +15,8 @@ async def test_create_batch(mocker, handler_instance, mock_sender, mock_session)
         patch("curator.core.handler.ensure_user") as mock_ensure_user,
         patch("curator.core.handler.create_batch") as mock_create_batch,
     ):
-        mock_batch = mocker.MagicMock()
-        mock_batch.id = 123
+        mock_batch = mocker.create_autospec(Batch, instance=True)
+        mock_batch.configure_mock(id=123)
         mock_create_batch.return_value = mock_batch
 
         await handler_instance.create_batch()
@@ -27,9 +28,8 @@ async def test_create_batch(mocker, handler_instance, mock_sender, mock_session)
 
 @pytest.mark.asyncio
 async def test_upload_slice(mocker, handler_instance, mock_sender, mock_session):
-    mock_batch = mocker.MagicMock()
-    mock_batch.id = 123
-    mock_batch.edit_group_id = "abc123def456"
+    mock_batch = mocker.create_autospec(Batch, instance=True)
+    mock_batch.configure_mock(id=123, edit_group_id="abc123def456")
     mock_session.get.return_value = mock_batch
 
     with (
@@ -87,9 +87,8 @@ async def test_upload_slice(mocker, handler_instance, mock_sender, mock_session)
 async def test_upload_slice_multiple_items(
     mocker, handler_instance, mock_sender, mock_session
 ):
-    mock_batch = mocker.MagicMock()
-    mock_batch.id = 123
-    mock_batch.edit_group_id = "xyz789uvw012"
+    mock_batch = mocker.create_autospec(Batch, instance=True)
+    mock_batch.configure_mock(id=123, edit_group_id="xyz789uvw012")
     mock_session.get.return_value = mock_batch
 
     with (
@@ -98,6 +98,7 @@ class TestBatchCreationEditGroupId:
         assert batch1.edit_group_id != batch2.edit_group_id
 
 
+@pytest.mark.mock_externals
 class TestUploadSliceUsesBatchEditGroupId:
     """Test upload_slice uses batch's edit_group_id"""
 
@@ -149,6 +150,7 @@ class TestUploadSliceUsesBatchEditGroupId:
             assert call_kwargs["args"][1] == "abc123def456"
 
 
+@pytest.mark.mock_externals
 class TestRetryCreatesNewBatch:
     """Test retries create new batches with their own edit_group_id"""
 
@@ -7,6 +7,8 @@ import pytest
 
 from curator.asyncapi import RetryUploads
 
+pytestmark = pytest.mark.mock_externals
+
 
 @pytest.mark.asyncio
 async def test_handle_subscribe_batch(handler_instance, mock_sender):
@@ -146,3 +146,13 @@ def test_ws_invalid_message():
         data = websocket.receive_json()
         assert data["type"] == "ERROR"
         assert data["data"] == "Invalid message format"
+
+
+def test_ws_malformed_json():
+    """Test that a frame that is not valid JSON returns error."""
+    with client.websocket_connect(WS_CHANNEL_ADDRESS) as websocket:
+        websocket.send_text("{not json")
+
+        data = websocket.receive_json()
+        assert data["type"] == "ERROR"
+        assert data["data"] == "Invalid message format"
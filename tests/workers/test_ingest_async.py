@@ -7,6 +7,8 @@ import pytest
 from curator.asyncapi import GenericError
 from curator.workers.ingest import process_one
 
+pytestmark = pytest.mark.mock_externals
+
 
 @pytest.fixture(autouse=True)
 def patch_ingest_get_session(patch_get_session):
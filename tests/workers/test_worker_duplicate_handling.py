@@ -11,6 +11,8 @@ from curator.core.crypto import encrypt_access_token
 from curator.mediawiki.commons import DuplicateUploadError
 from curator.workers.ingest import process_one
 
+pytestmark = pytest.mark.mock_externals
+
 
 @pytest.fixture(autouse=True)
 def patch_ingest_get_session(patch_get_session):
@@ -16,6 +16,8 @@ from curator.asyncapi import (
 from curator.db.models import UploadRequest, User
 from curator.workers import ingest
 
+pytestmark = pytest.mark.mock_externals
+
 
 def make_image():
     return MediaImage(
@@ -10,6 +10,8 @@ from mwoauth import AccessToken
 from curator.core.crypto import encrypt_access_token
 from curator.workers.ingest import process_one
 
+pytestmark = pytest.mark.mock_externals
+
 _UPLOADSTASH_FILE_NOT_FOUND_ERROR = (
     'uploadstash-file-not-found: Key "1cbv2eph0ceg.op0el3.7498417.jpg" not found in stash.'
     " [servedby: mw-api-ext.codfw.main-6c9d649c6d-dfvpl;"
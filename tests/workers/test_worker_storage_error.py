@@ -16,6 +16,8 @@ from curator.workers.tasks import (
     process_upload,
 )
 
+pytestmark = pytest.mark.mock_externals
+
 _UPLOADSTASH_EXCEPTION_ERROR = (
     "uploadstash-exception: Could not store upload in the stash "
     "(MediaWiki\\Upload\\Exception\\UploadStashFileException): "